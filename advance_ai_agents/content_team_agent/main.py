@@ -29,7 +29,13 @@ Uses Nebius Token Factory for LLM inference:
 """
 
 import asyncio
+import hashlib
+import itertools
 import os
+import re
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
 from textwrap import dedent
@@ -37,6 +43,8 @@ from typing import Optional
 from urllib.parse import urlparse
 from datetime import datetime
 
+import orjson
+import tiktoken
 from agno.agent import Agent
 from agno.db.sqlite import SqliteDb
 from agno.models.nebius import Nebius
@@ -47,12 +55,33 @@ from agno.workflow.workflow import Workflow
 from pydantic import BaseModel
 
 from tools import (
+    cache_enabled,
+    cache_get,
+    cache_set,
     google_ai_mode_search,
     google_ai_overview_search,
-    extract_text_from_url,
+    extract_text_from_url_async,
 )
 import json
 
+# Re-running the workflow on the same URL skips the fetch and HTML parse
+ARTICLE_CACHE_SIZE = 128
+_article_text_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+async def fetch_article_text(url: str) -> str:
+    """Fetch article text for a URL, memoizing the most recent results."""
+    if url in _article_text_cache:
+        _article_text_cache.move_to_end(url)
+        return _article_text_cache[url]
+    text = await extract_text_from_url_async(url)
+    # Failed fetches come back empty; leave them uncached so they get retried
+    if text:
+        _article_text_cache[url] = text
+        if len(_article_text_cache) > ARTICLE_CACHE_SIZE:
+            _article_text_cache.popitem(last=False)
+    return text
+
 
 # --- Response models ---
 class ArticleTopic(BaseModel):
@@ -125,6 +154,41 @@ content_brief_report = str(reports_dir.joinpath("content_brief.md"))
 article_audit_report = str(reports_dir.joinpath("article_audit.md"))
 section_edits_report = str(reports_dir.joinpath("section_edits.md"))
 
+# Translation tables for building article filenames from URLs
+_DOMAIN_TABLE = str.maketrans({".": "_"})
+_FILENAME_TABLE = {
+    b: None for b in range(256) if not (chr(b).isalnum() or chr(b) in "-_")
+}
+
+# Matches whitespace-separated words without splitting the whole article
+_WORD_RE = re.compile(r"\S+")
+
+# Token-aware truncation of article content sent to the LLMs
+TOPIC_EXTRACTION_MAX_TOKENS = 1500
+AUDIT_MAX_TOKENS = 3500
+# Tokens average ~4 characters, so 8x leaves ample headroom for the largest
+# truncation below; _encode_article falls back to the full text otherwise
+_ENCODE_PREFIX_CHARS = AUDIT_MAX_TOKENS * 8
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> "tiktoken.Encoding":
+    """Load the tokenizer on first use instead of at import time."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _encode_article(text: str) -> list[int]:
+    """Encode enough of `text` to cover every truncation site."""
+    token_ids = _get_encoding().encode(text[:_ENCODE_PREFIX_CHARS])
+    if len(token_ids) < AUDIT_MAX_TOKENS and len(text) > _ENCODE_PREFIX_CHARS:
+        token_ids = _get_encoding().encode(text)
+    return token_ids
+
+
+def _truncate_to_tokens(token_ids: list[int], max_tokens: int) -> str:
+    """Decode at most `max_tokens` of an already-encoded text."""
+    return _get_encoding().decode(token_ids[:max_tokens])
+
 
 # --- Custom tools for agents ---
 @tool()
@@ -326,131 +390,152 @@ seo_editor_agent = Agent(
 )
 
 
-# --- Execution function ---
-async def content_seo_execution(
-    execution_input: WorkflowExecutionInput,
-    topic: Optional[str] = None,
-    title: Optional[str] = None,
-    content: Optional[str] = None,
-    url: Optional[str] = None,
+# --- Article persistence ---
+ARTICLE_WRITE_CHUNK_SIZE = 65536
+
+
+async def _write_article(
+    path: Path, url: str, text: str, extracted_at: datetime
+) -> None:
+    """Write an extracted article to disk off the event loop, in chunks."""
+
+    def _write() -> None:
+        with open(path, "wb") as f:
+            f.write(
+                (
+                    "# Extracted Article\n\n"
+                    f"**Source URL:** {url}\n\n"
+                    f"**Extracted:** {extracted_at.strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                    "---\n\n"
+                ).encode("utf-8")
+            )
+            for i in range(0, len(text), ARTICLE_WRITE_CHUNK_SIZE):
+                f.write(text[i : i + ARTICLE_WRITE_CHUNK_SIZE].encode("utf-8"))
+
+    await asyncio.to_thread(_write)
+
+
+# --- Workflow result cache ---
+# The agents sample their output, so replaying a previous run for the same
+# inputs is opt-in; SerpAPI responses and article fetches are cached regardless
+ENABLE_WORKFLOW_CACHE = os.getenv("ENABLE_WORKFLOW_CACHE", "0") == "1"
+WORKFLOW_CACHE_TTL_SECONDS = 86400
+
+
+def _workflow_cache_key(
+    topic: Optional[str],
+    title: Optional[str],
+    content: Optional[str],
+    url: Optional[str],
 ) -> str:
-    """Execute the Content Team SEO workflow."""
+    """Build the Redis key for a workflow run from its inputs."""
+    raw_key = f"{topic}|{url}|{title}|{content or ''}"
+    return f"seo:{hashlib.sha256(raw_key.encode('utf-8')).hexdigest()}"
 
-    # Determine mode and normalize inputs
-    article_text = None
-    article_title = None
-    is_existing_article = False
 
-    if url:
-        print(f"🌐 Extracting content from URL: {url}")
-        article_text = extract_text_from_url(url)
-        if article_text:
-            is_existing_article = True
-            print(f"✓ Extracted {len(article_text)} characters from URL")
+# --- Prompt templates ---
+_TOPIC_EXTRACTION_PROMPT = """\
+Analyze this article content and extract the main topic, title, and key themes:
 
-            # Save extracted article to articles folder
-            try:
-                # Generate filename from URL or use timestamp
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc.replace("www.", "").replace(".", "_")
-                path_parts = [p for p in parsed_url.path.strip("/").split("/") if p]
-                if path_parts:
-                    filename_base = (
-                        path_parts[-1].replace(".html", "").replace(".htm", "")
-                    )
-                else:
-                    filename_base = "article"
+{title_line}
+CONTENT:
+{article_content}
 
-                # Clean filename
-                filename_base = "".join(
-                    c for c in filename_base if c.isalnum() or c in ("-", "_")
-                )[:50]
-                if not filename_base:
-                    filename_base = "article"
+Extract the main topic, article title, key themes, and suggest the best search query for SEO research.
+"""
 
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                article_filename = f"{domain}_{filename_base}_{timestamp}.md"
-                article_filepath = articles_dir.joinpath(article_filename)
+_ANALYSIS_PROMPT = """\
+Analyze the SERP results from both Google AI Mode and AI Overview searches for: {search_query}
 
-                # Save article content
-                with open(article_filepath, "w", encoding="utf-8") as f:
-                    f.write(f"# Extracted Article\n\n")
-                    f.write(f"**Source URL:** {url}\n\n")
-                    f.write(
-                        f"**Extracted:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                    )
-                    f.write("---\n\n")
-                    f.write(article_text)
+{ai_mode_formatted}
 
-                print(f"✓ Article saved to: {article_filepath}")
-            except Exception as e:
-                print(f"⚠️ Warning: Could not save article to file: {e}")
-        else:
-            print(
-                "⚠️ Failed to extract content from URL. Proceeding with topic-only mode."
-            )
+{ai_overview_formatted}
 
-    if title and content:
-        article_title = title
-        article_text = content
-        is_existing_article = True
-        print(f"✓ Using provided title and content ({len(content)} characters)")
+Based on these comprehensive SERP results, analyze and provide structured insights:
 
-    if not topic and not is_existing_article:
-        return "Error: Please provide either a topic, URL, or title+content."
+1. PRIMARY KEYWORDS: Identify the main keywords and phrases that are most important for ranking. Consider what terms appear in titles, snippets, and are emphasized in the AI Overview.
 
-    # Extract topic from article if we have content but no explicit topic
-    if is_existing_article and not topic:
-        print("\n📝 Extracting article topic and title from content...")
-        topic_extraction_prompt = f"""
-        Analyze this article content and extract the main topic, title, and key themes:
-        
-        {'TITLE: ' + article_title + chr(10) if article_title else ''}
-        CONTENT:
-        {article_text[:6000]}  # Limit to avoid token limits
-        
-        Extract the main topic, article title, key themes, and suggest the best search query for SEO research.
-        """
+2. RELATED KEYWORDS: List semantic variations, related terms, and keyword clusters that are relevant to this topic. Include synonyms, related concepts, and long-tail variations.
 
-        try:
-            topic_result = await topic_extraction_agent.arun(topic_extraction_prompt)
-            extracted_topic = topic_result.content
+3. RELATED QUESTIONS: Extract all questions from "Related Questions" and "People Also Ask" sections. These represent FAQ opportunities and user intent patterns.
 
-            # Use extracted topic for search query
-            search_query = extracted_topic.search_query_suggestion
-            if not article_title and extracted_topic.article_title:
-                article_title = extracted_topic.article_title
+4. SEARCH INTENT: Determine the primary user intent (informational, commercial, navigational, transactional). Analyze what users are really trying to accomplish with this search.
 
-            print(f"✓ Extracted topic: {extracted_topic.main_topic}")
-            print(f"✓ Article title: {extracted_topic.article_title}")
-            print(f"✓ Search query: {search_query}")
-        except Exception as e:
-            print(f"⚠️ Error extracting topic: {e}")
-            # Fallback: use title or first few words of content
-            if article_title:
-                search_query = article_title
-            else:
-                # Extract first sentence or first 50 words as fallback
-                first_words = article_text.split()[:10] if article_text else []
-                search_query = (
-                    " ".join(first_words) if first_words else "content optimization"
-                )
-            print(f"⚠️ Using fallback search query: {search_query}")
-    else:
-        # Use provided topic or title
-        search_query = (
-            topic
-            if topic
-            else (article_title if article_title else "content optimization")
-        )
+5. COMPETITOR ANALYSIS: Analyze the top-ranking organic results. What topics do they cover? What angles do they take? What content patterns emerge? What are their strengths?
 
-    print(f"\n{'='*70}")
-    print(
-        f"Mode: {'EXISTING ARTICLE OPTIMIZATION' if is_existing_article else 'PRE-WRITING CONTENT BRIEF'}"
-    )
-    print(f"Search Query: {search_query}")
-    print(f"{'='*70}\n")
+6. AI OVERVIEW SUMMARY: Summarize what Google's AI Overview highlights. What key information, facts, or claims does Google emphasize? What structure and format does it use?
+
+Provide comprehensive, actionable SEO insights that will inform content strategy for ranking on Google AI Search.
+"""
+
+_AUDIT_PROMPT = """\
+Analyze and audit this existing article for SEO optimization:
+
+TITLE: {article_title}
+
+CONTENT:
+{article_content}
+
+SEARCH INSIGHTS:
+- Primary Keywords: {primary_keywords}
+- Related Keywords: {related_keywords}
+- Related Questions: {related_questions}
+- Search Intent: {search_intent}
+- Competitor Analysis: {competitor_analysis}
+- AI Overview: {ai_overview_summary}
+
+Provide a comprehensive audit with prioritized improvement recommendations.
+"""
+
+_REWRITE_PROMPT = """\
+Based on the audit below, rewrite and optimize key sections of the article.
+Focus on sections that need the most improvement while keeping the main content and meaning intact.
+
+IMPORTANT: You have access to the FULL article content. Use the complete content to make informed,
+context-aware improvements. Don't just optimize isolated sections - consider how changes affect
+the overall article flow and coherence.
+
+ORIGINAL ARTICLE:
+Title: {article_title}
+
+FULL CONTENT:
+{article_text}
+
+AUDIT FINDINGS:
+- Content Gaps: {content_gaps}
+- Keyword Opportunities: {keyword_opportunities}
+- Structure Improvements: {structure_improvements}
+- Prioritized Recommendations: {prioritized_recommendations}
+
+SEARCH INSIGHTS:
+- Primary Keywords: {primary_keywords}
+- Related Keywords: {related_keywords}
+- Related Questions: {related_questions}
 
+Provide improved versions of the most important sections with natural keyword integration.
+Explain what changed and why each change improves SEO potential.
+"""
+
+_BRIEF_PROMPT = """\
+Create a comprehensive content brief for writing an SEO-optimized article on: {search_query}
+
+SEARCH INSIGHTS:
+- Primary Keywords: {primary_keywords}
+- Related Keywords: {related_keywords}
+- Related Questions: {related_questions}
+- Search Intent: {search_intent}
+- Competitor Analysis: {competitor_analysis}
+- AI Overview: {ai_overview_summary}
+
+Provide a detailed content brief that will guide the writing of a rankable article.
+"""
+
+
+# --- Execution function ---
+async def _run_search_insights_phase(
+    search_query: str, article_title: Optional[str]
+) -> SearchInsights:
+    """Gather SERP data, analyze it and save the search insights report."""
     # Phase 1: Search Insights
     print("PHASE 1: SEARCH INSIGHTS & KEYWORD RESEARCH")
     print("=" * 70)
@@ -459,20 +544,24 @@ async def content_seo_execution(
     print("🔍 Gathering raw SERP data from Google AI Mode and AI Overview...")
     print("📊 Fetching search results...")
 
-    ai_mode_results = {}
-    ai_overview_results = {}
+    # Both SerpAPI calls are blocking and independent, so run them concurrently
+    ai_mode_results, ai_overview_results = await asyncio.gather(
+        asyncio.to_thread(google_ai_mode_search, search_query),
+        asyncio.to_thread(google_ai_overview_search, search_query),
+        return_exceptions=True,
+    )
 
-    try:
-        ai_mode_results = google_ai_mode_search(search_query)
+    if isinstance(ai_mode_results, Exception):
+        print(f"⚠️ Error fetching Google AI Mode results: {ai_mode_results}")
+        ai_mode_results = {}
+    else:
         print("✓ Google AI Mode results fetched")
-    except Exception as e:
-        print(f"⚠️ Error fetching Google AI Mode results: {e}")
 
-    try:
-        ai_overview_results = google_ai_overview_search(search_query)
+    if isinstance(ai_overview_results, Exception):
+        print(f"⚠️ Error fetching Google AI Overview results: {ai_overview_results}")
+        ai_overview_results = {}
+    else:
         print("✓ Google AI Overview results fetched")
-    except Exception as e:
-        print(f"⚠️ Error fetching Google AI Overview results: {e}")
 
     # Step 2: Format results for analysis
     def format_serp_results_for_analysis(results: dict, result_type: str) -> str:
@@ -549,35 +638,17 @@ async def content_seo_execution(
         ai_overview_results, "Google AI Overview"
     )
 
-    analysis_prompt = f"""
-    Analyze the SERP results from both Google AI Mode and AI Overview searches for: {search_query}
-    
-    {ai_mode_formatted}
-    
-    {ai_overview_formatted}
-    
-    Based on these comprehensive SERP results, analyze and provide structured insights:
-    
-    1. PRIMARY KEYWORDS: Identify the main keywords and phrases that are most important for ranking. Consider what terms appear in titles, snippets, and are emphasized in the AI Overview.
-    
-    2. RELATED KEYWORDS: List semantic variations, related terms, and keyword clusters that are relevant to this topic. Include synonyms, related concepts, and long-tail variations.
-    
-    3. RELATED QUESTIONS: Extract all questions from "Related Questions" and "People Also Ask" sections. These represent FAQ opportunities and user intent patterns.
-    
-    4. SEARCH INTENT: Determine the primary user intent (informational, commercial, navigational, transactional). Analyze what users are really trying to accomplish with this search.
-    
-    5. COMPETITOR ANALYSIS: Analyze the top-ranking organic results. What topics do they cover? What angles do they take? What content patterns emerge? What are their strengths?
-    
-    6. AI OVERVIEW SUMMARY: Summarize what Google's AI Overview highlights. What key information, facts, or claims does Google emphasize? What structure and format does it use?
-    
-    Provide comprehensive, actionable SEO insights that will inform content strategy for ranking on Google AI Search.
-    """
+    analysis_prompt = _ANALYSIS_PROMPT.format(
+        search_query=search_query,
+        ai_mode_formatted=ai_mode_formatted,
+        ai_overview_formatted=ai_overview_formatted,
+    )
 
     analysis_result = await serp_analysis_agent.arun(analysis_prompt)
     search_insights = analysis_result.content
 
     # Save search insights
-    with open(search_insights_report, "w") as f:
+    with open(search_insights_report, "w", encoding="utf-8") as f:
         f.write("# Search Insights & Keyword Research\n\n")
         if article_title:
             f.write(f"**Article Title:** {article_title}\n\n")
@@ -591,6 +662,160 @@ async def content_seo_execution(
 
     print(f"✓ Search insights saved to {search_insights_report}")
 
+    return search_insights
+
+
+async def content_seo_execution(
+    execution_input: WorkflowExecutionInput,
+    topic: Optional[str] = None,
+    title: Optional[str] = None,
+    content: Optional[str] = None,
+    url: Optional[str] = None,
+) -> str:
+    """Execute the Content Team SEO workflow."""
+
+    # When enabled, repeated inputs reuse the previous run's summary and reports
+    cache_key = _workflow_cache_key(topic, title, content, url)
+    cached_run = cache_get(cache_key) if ENABLE_WORKFLOW_CACHE else None
+    if cached_run is not None:
+        cached_run = orjson.loads(cached_run)
+        for report_path, report_md in cached_run["reports"].items():
+            Path(report_path).write_text(report_md, encoding="utf-8")
+        print("✓ Using cached SEO analysis for these inputs")
+        return cached_run["summary"]
+
+    # Determine mode and normalize inputs
+    article_text = None
+    article_title = None
+    is_existing_article = False
+    article_write_task = None
+    article_filepath = None
+
+    if url:
+        print(f"🌐 Extracting content from URL: {url}")
+        article_text = await fetch_article_text(url)
+        if article_text:
+            is_existing_article = True
+            print(f"✓ Extracted {len(article_text)} characters from URL")
+
+            # Save extracted article to articles folder
+            try:
+                # Generate filename from URL or use timestamp
+                parsed_url = urlparse(url)
+                domain = parsed_url.netloc.removeprefix("www.").translate(
+                    _DOMAIN_TABLE
+                )
+                path_parts = [p for p in parsed_url.path.strip("/").split("/") if p]
+                if path_parts:
+                    filename_base = (
+                        path_parts[-1].replace(".html", "").replace(".htm", "")
+                    )
+                else:
+                    filename_base = "article"
+
+                # Clean filename
+                filename_base = filename_base.translate(_FILENAME_TABLE)[:50]
+                if not filename_base:
+                    filename_base = "article"
+
+                extracted_at = datetime.now()
+                timestamp = extracted_at.strftime("%Y%m%d_%H%M%S")
+                article_filename = f"{domain}_{filename_base}_{timestamp}.md"
+                article_filepath = articles_dir.joinpath(article_filename)
+
+                # Save article content in the background; awaited after Phase 1
+                article_write_task = asyncio.create_task(
+                    _write_article(article_filepath, url, article_text, extracted_at)
+                )
+            except Exception as e:
+                print(f"⚠️ Warning: Could not save article to file: {e}")
+        else:
+            print(
+                "⚠️ Failed to extract content from URL. Proceeding with topic-only mode."
+            )
+
+    if title and content:
+        article_title = title
+        article_text = content
+        is_existing_article = True
+        print(f"✓ Using provided title and content ({len(content)} characters)")
+
+    if not topic and not is_existing_article:
+        return "Error: Please provide either a topic, URL, or title+content."
+
+    # Encode once and reuse for every truncation site below
+    article_tokens = _encode_article(article_text) if article_text else []
+
+    # Extract topic from article if we have content but no explicit topic
+    if is_existing_article and not topic:
+        print("\n📝 Extracting article topic and title from content...")
+        topic_extraction_prompt = _TOPIC_EXTRACTION_PROMPT.format(
+            title_line=f"TITLE: {article_title}\n" if article_title else "",
+            article_content=_truncate_to_tokens(
+                article_tokens, TOPIC_EXTRACTION_MAX_TOKENS
+            ),
+        )
+
+        try:
+            topic_result = await topic_extraction_agent.arun(topic_extraction_prompt)
+            extracted_topic = topic_result.content
+
+            # Use extracted topic for search query
+            search_query = extracted_topic.search_query_suggestion
+            if not article_title and extracted_topic.article_title:
+                article_title = extracted_topic.article_title
+
+            print(f"✓ Extracted topic: {extracted_topic.main_topic}")
+            print(f"✓ Article title: {extracted_topic.article_title}")
+            print(f"✓ Search query: {search_query}")
+        except Exception as e:
+            print(f"⚠️ Error extracting topic: {e}")
+            # Fallback: use title or first few words of content
+            if article_title:
+                search_query = article_title
+            else:
+                # Extract first sentence or first 50 words as fallback
+                first_words = (
+                    [
+                        m.group(0)
+                        for m in itertools.islice(_WORD_RE.finditer(article_text), 10)
+                    ]
+                    if article_text
+                    else []
+                )
+                search_query = (
+                    " ".join(first_words) if first_words else "content optimization"
+                )
+            print(f"⚠️ Using fallback search query: {search_query}")
+    else:
+        # Use provided topic or title
+        search_query = (
+            topic
+            if topic
+            else (article_title if article_title else "content optimization")
+        )
+
+    print(f"\n{'='*70}")
+    print(
+        f"Mode: {'EXISTING ARTICLE OPTIMIZATION' if is_existing_article else 'PRE-WRITING CONTENT BRIEF'}"
+    )
+    print(f"Search Query: {search_query}")
+    print(f"{'='*70}\n")
+
+    # Phase 1 runs while the article is written; the write is always awaited,
+    # even when Phase 1 fails, so the task is never left pending
+    try:
+        search_insights = await _run_search_insights_phase(
+            search_query, article_title
+        )
+    finally:
+        if article_write_task is not None:
+            try:
+                await article_write_task
+                print(f"✓ Article saved to: {article_filepath}")
+            except Exception as e:
+                print(f"⚠️ Warning: Could not save article to file: {e}")
+
     # Phase 2: Content Strategy (mode-specific)
     print(
         f"\nPHASE 2: {'ARTICLE AUDIT' if is_existing_article else 'CONTENT BRIEF GENERATION'}"
@@ -621,31 +846,18 @@ async def content_seo_execution(
         """
         )
 
-        audit_prompt = f"""
-        Analyze and audit this existing article for SEO optimization:
-        
-        TITLE: {article_title or 'Untitled'}
-        
-        CONTENT:
-        {article_text[:12000]}  # Increased limit for better analysis
-        
-        SEARCH INSIGHTS:
-        - Primary Keywords: {search_insights.primary_keywords}
-        - Related Keywords: {search_insights.related_keywords}
-        - Related Questions: {search_insights.related_questions}
-        - Search Intent: {search_insights.search_intent}
-        - Competitor Analysis: {search_insights.competitor_analysis}
-        - AI Overview: {search_insights.ai_overview_summary}
-        
-        Provide a comprehensive audit with prioritized improvement recommendations.
-        """
+        audit_prompt = _AUDIT_PROMPT.format(
+            article_title=article_title or "Untitled",
+            article_content=_truncate_to_tokens(article_tokens, AUDIT_MAX_TOKENS),
+            **search_insights.model_dump(),
+        )
 
         print("📊 Auditing article and identifying improvements...")
         audit_result = await content_strategist_agent.arun(audit_prompt)
         article_audit = audit_result.content
 
         # Save audit report
-        with open(article_audit_report, "w") as f:
+        with open(article_audit_report, "w", encoding="utf-8") as f:
             f.write("# Article SEO Audit & Improvement Plan\n\n")
             f.write(f"**Article Title:** {article_title or 'Untitled'}\n\n")
             f.write(f"## Content Strengths\n{article_audit.content_strengths}\n\n")
@@ -668,41 +880,19 @@ async def content_seo_execution(
         print("\nPHASE 3: SECTION OPTIMIZATION & REWRITES")
         print("=" * 70)
 
-        rewrite_prompt = f"""
-        Based on the audit below, rewrite and optimize key sections of the article.
-        Focus on sections that need the most improvement while keeping the main content and meaning intact.
-        
-        IMPORTANT: You have access to the FULL article content. Use the complete content to make informed,
-        context-aware improvements. Don't just optimize isolated sections - consider how changes affect
-        the overall article flow and coherence.
-        
-        ORIGINAL ARTICLE:
-        Title: {article_title or 'Untitled'}
-        
-        FULL CONTENT:
-        {article_text}
-        
-        AUDIT FINDINGS:
-        - Content Gaps: {article_audit.content_gaps}
-        - Keyword Opportunities: {article_audit.keyword_opportunities}
-        - Structure Improvements: {article_audit.structure_improvements}
-        - Prioritized Recommendations: {article_audit.prioritized_recommendations}
-        
-        SEARCH INSIGHTS:
-        - Primary Keywords: {search_insights.primary_keywords}
-        - Related Keywords: {search_insights.related_keywords}
-        - Related Questions: {search_insights.related_questions}
-        
-        Provide improved versions of the most important sections with natural keyword integration.
-        Explain what changed and why each change improves SEO potential.
-        """
+        rewrite_prompt = _REWRITE_PROMPT.format(
+            article_title=article_title or "Untitled",
+            article_text=article_text,
+            **article_audit.model_dump(),
+            **search_insights.model_dump(),
+        )
 
         print("✏️ Optimizing sections with keyword integration...")
         rewrite_result = await seo_editor_agent.arun(rewrite_prompt)
         section_edits = rewrite_result.content
 
         # Save section edits
-        with open(section_edits_report, "w") as f:
+        with open(section_edits_report, "w", encoding="utf-8") as f:
             f.write("# Optimized Section Rewrites\n\n")
             f.write(f"**Article Title:** {article_title or 'Untitled'}\n\n")
             f.write(f"## Improved Sections\n{section_edits.improved_sections}\n\n")
@@ -758,44 +948,30 @@ Next Steps:
         """
         )
 
-        brief_prompt = f"""
-        Create a comprehensive content brief for writing an SEO-optimized article on: {search_query}
-        
-        SEARCH INSIGHTS:
-        - Primary Keywords: {search_insights.primary_keywords}
-        - Related Keywords: {search_insights.related_keywords}
-        - Related Questions: {search_insights.related_questions}
-        - Search Intent: {search_insights.search_intent}
-        - Competitor Analysis: {search_insights.competitor_analysis}
-        - AI Overview: {search_insights.ai_overview_summary}
-        
-        Provide a detailed content brief that will guide the writing of a rankable article.
-        """
+        brief_prompt = _BRIEF_PROMPT.format(
+            search_query=search_query, **search_insights.model_dump()
+        )
 
         print("📝 Generating content brief and writing guidelines...")
         brief_result = await content_strategist_agent.arun(brief_prompt)
         content_brief = brief_result.content
 
-        # Save content brief
-        with open(content_brief_report, "w") as f:
-            f.write("# Content Brief & SEO Writing Guidelines\n\n")
-            f.write(f"**Topic:** {search_query}\n\n")
-            f.write(f"## Target Intent\n{content_brief.target_intent}\n\n")
-            f.write(f"## Content Outline\n{content_brief.content_outline}\n\n")
-            f.write(
-                f"## Recommended Headings\n{content_brief.recommended_headings}\n\n"
-            )
-            f.write(
-                f"## Key Entities to Mention\n{content_brief.key_entities_to_mention}\n\n"
-            )
-            f.write(f"## FAQ Suggestions\n{content_brief.faq_suggestions}\n\n")
-            f.write(
-                f"## Keyword Placement Guidance\n{content_brief.keyword_placement_guidance}\n\n"
-            )
-            f.write(
-                f"## Content Structure Recommendations\n{content_brief.content_structure_recommendations}\n\n"
-            )
-            f.write(f"## Writing Guidelines\n{content_brief.writing_guidelines}\n")
+        # Save content brief in a single write, off the event loop
+        content_brief_md = (
+            "# Content Brief & SEO Writing Guidelines\n\n"
+            f"**Topic:** {search_query}\n\n"
+            f"## Target Intent\n{content_brief.target_intent}\n\n"
+            f"## Content Outline\n{content_brief.content_outline}\n\n"
+            f"## Recommended Headings\n{content_brief.recommended_headings}\n\n"
+            f"## Key Entities to Mention\n{content_brief.key_entities_to_mention}\n\n"
+            f"## FAQ Suggestions\n{content_brief.faq_suggestions}\n\n"
+            f"## Keyword Placement Guidance\n{content_brief.keyword_placement_guidance}\n\n"
+            f"## Content Structure Recommendations\n{content_brief.content_structure_recommendations}\n\n"
+            f"## Writing Guidelines\n{content_brief.writing_guidelines}\n"
+        )
+        await asyncio.to_thread(
+            Path(content_brief_report).write_text, content_brief_md, encoding="utf-8"
+        )
 
         print(f"✓ Content brief saved to {content_brief_report}")
 
@@ -820,6 +996,27 @@ Next Steps:
 4. Use the writing guidelines while drafting
 """
 
+    # Reading the reports back only matters when there is a cache to fill
+    if ENABLE_WORKFLOW_CACHE and cache_enabled():
+        report_paths = (
+            [search_insights_report, article_audit_report, section_edits_report]
+            if is_existing_article
+            else [search_insights_report, content_brief_report]
+        )
+        cache_set(
+            cache_key,
+            orjson.dumps(
+                {
+                    "summary": summary,
+                    "reports": {
+                        path: Path(path).read_text(encoding="utf-8")
+                        for path in report_paths
+                    },
+                }
+            ),
+            WORKFLOW_CACHE_TTL_SECONDS,
+        )
+
     return summary
 
 
@@ -867,18 +1064,10 @@ if __name__ == "__main__":
         elif choice == "3":
             title = Prompt.ask("[bold]Enter the article title[/bold]")
             print(
-                "\n[dim]Paste your article content (press Enter twice when done):[/dim]"
+                "\nPaste your article content, then press Ctrl-D "
+                "(Ctrl-Z then Enter on Windows) when done:"
             )
-            lines = []
-            while True:
-                try:
-                    line = input()
-                    if line == "" and lines and lines[-1] == "":
-                        break
-                    lines.append(line)
-                except EOFError:
-                    break
-            content = "\n".join(lines).strip()
+            content = sys.stdin.read().strip()
         else:
             print("Invalid choice. Using topic mode.")
             topic = Prompt.ask("[bold]Enter the topic[/bold]")
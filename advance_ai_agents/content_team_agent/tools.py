@@ -1,11 +1,95 @@
 from serpapi import GoogleSearch
+import asyncio
+import atexit
+import functools
+import hashlib
 import os
 from dotenv import load_dotenv
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
+import orjson
+import redis
 import trafilatura
 import httpx
 load_dotenv()
 
+SERP_CACHE_TTL_SECONDS = 3600
+
+# Optional Redis cache for SerpAPI responses; disabled when REDIS_URL is unset
+_REDIS_URL = os.getenv("REDIS_URL")
+_REDIS_CLIENT = redis.Redis.from_url(_REDIS_URL) if _REDIS_URL else None
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+_HTTP_CLIENT_OPTIONS = {
+    "timeout": 30.0,
+    "headers": HEADERS,
+    "follow_redirects": True,
+    "http2": True,
+    "limits": httpx.Limits(max_keepalive_connections=20, max_connections=100),
+}
+
+# Shared clients so repeated fetches reuse pooled TCP/TLS connections. The
+# insecure client is only used to retry fetches that failed TLS verification.
+_HTTP_CLIENT = httpx.Client(**_HTTP_CLIENT_OPTIONS)
+_INSECURE_HTTP_CLIENT = httpx.Client(verify=False, **_HTTP_CLIENT_OPTIONS)
+atexit.register(_HTTP_CLIENT.close)
+atexit.register(_INSECURE_HTTP_CLIENT.close)
+
+
+def cache_enabled() -> bool:
+    """Whether a Redis cache is configured."""
+    return _REDIS_CLIENT is not None
+
+
+def cache_get(key: str) -> Optional[bytes]:
+    """Read a value from the Redis cache, or None if missing or disabled."""
+    if _REDIS_CLIENT is None:
+        return None
+    try:
+        return _REDIS_CLIENT.get(key)
+    except redis.RedisError as e:
+        print(f"Warning: cache read failed for {key}: {e}")
+        return None
+
+
+def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Write a value to the Redis cache with a TTL; no-op when disabled."""
+    if _REDIS_CLIENT is None:
+        return
+    try:
+        _REDIS_CLIENT.setex(key, ttl_seconds, value)
+    except redis.RedisError as e:
+        print(f"Warning: cache write failed for {key}: {e}")
+
+
+def _serp_cached(func: Callable[[str], dict]) -> Callable[[str], dict]:
+    """Cache a SerpAPI search in Redis, keyed by function name and query hash."""
+
+    @functools.wraps(func)
+    def wrapper(query: str) -> dict:
+        if _REDIS_CLIENT is None:
+            return func(query)
+
+        query_hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        cache_key = f"serp:{func.__name__}:{query_hash}"
+        cached = cache_get(cache_key)
+        if cached is not None:
+            print(f"SERP cache hit: {func.__name__}")
+            return orjson.loads(cached)
+
+        print(f"SERP cache miss: {func.__name__}")
+        results = func(query)
+        # Don't cache SerpAPI error payloads
+        if results and "error" not in results:
+            cache_set(cache_key, orjson.dumps(results), SERP_CACHE_TTL_SECONDS)
+        return results
+
+    return wrapper
+
+
+@_serp_cached
 def google_ai_mode_search(query: str) -> dict:
     """Search Google AI Mode for a query and return results."""
     params = {
@@ -18,6 +102,7 @@ def google_ai_mode_search(query: str) -> dict:
     return results
 
 
+@_serp_cached
 def google_ai_overview_search(query: str) -> dict:
     """Search Google AI Overview for a query and return results."""
     params = {
@@ -29,6 +114,30 @@ def google_ai_overview_search(query: str) -> dict:
     results = search.get_dict()
     return results
 
+def _extract_article_text(html_content: Optional[str], url: str) -> str:
+    """Run trafilatura over fetched HTML and keep only meaningful text."""
+    if not html_content:
+        print(f"Warning: Failed to fetch HTML content from {url}")
+        return ""
+
+    # Extract text using trafilatura, skipping the slow fallback extractors
+    text = trafilatura.extract(
+        html_content,
+        output_format="txt",
+        no_fallback=True,
+        deduplicate=True,
+        include_comments=False,
+        include_tables=True,
+        include_formatting=False,
+        include_links=False,
+        include_images=False,
+    )
+    if text and len(text.strip()) > 100:  # Ensure we got meaningful content
+        return text.strip()
+    print(f"Warning: Extracted text too short or empty from {url}")
+    return ""
+
+
 def extract_text_from_url(url: str) -> str:
     """
     Extract readable article text from a URL.
@@ -40,43 +149,23 @@ def extract_text_from_url(url: str) -> str:
         Extracted article text, or empty string if extraction fails
     """
     try:
-        # First, try using trafilatura with custom headers
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-
         # Try fetching with httpx first for better control
         try:
-            with httpx.Client(
-                timeout=30.0, headers=headers, follow_redirects=True
-            ) as client:
-                response = client.get(url)
-                response.raise_for_status()
-                html_content = response.text
+            response = _HTTP_CLIENT.get(url)
+            response.raise_for_status()
+            html_content = response.text
         except Exception as http_error:
             print(f"HTTP error fetching URL {url}: {http_error}")
-            # Fallback to trafilatura's fetch_url
-            html_content = trafilatura.fetch_url(url, no_ssl=True)
-            if not html_content:
+            # Retry once without certificate verification on the pooled stack
+            try:
+                response = _INSECURE_HTTP_CLIENT.get(url)
+                response.raise_for_status()
+                html_content = response.text
+            except Exception as retry_error:
+                print(f"HTTP retry failed for URL {url}: {retry_error}")
                 return ""
 
-        if html_content:
-            # Extract text using trafilatura
-            text = trafilatura.extract(
-                html_content,
-                include_comments=False,
-                include_tables=True,
-                include_links=False,
-                include_images=False,
-            )
-            if text and len(text.strip()) > 100:  # Ensure we got meaningful content
-                return text.strip()
-            else:
-                print(f"Warning: Extracted text too short or empty from {url}")
-                return ""
-        else:
-            print(f"Warning: Failed to fetch HTML content from {url}")
-            return ""
+        return _extract_article_text(html_content, url)
 
     except Exception as e:
         print(f"Error extracting text from URL {url}: {e}")
@@ -84,3 +173,13 @@ def extract_text_from_url(url: str) -> str:
 
         traceback.print_exc()
         return ""
+
+
+async def extract_text_from_url_async(url: str) -> str:
+    """
+    Async variant of `extract_text_from_url` for use inside the workflow.
+
+    Runs the sync extractor in a worker thread so fetches reuse the pooled
+    module-level clients instead of opening new connections per call.
+    """
+    return await asyncio.to_thread(extract_text_from_url, url)
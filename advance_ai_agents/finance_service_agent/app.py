@@ -1,10 +1,11 @@
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from utils.redisCache import lifespan, get_cache
 from routes.stockRoutes import router as stock_router
 from routes.agentRoutes import router as agent_router
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], 
@@ -14,4 +15,9 @@ app.add_middleware(
 )
 
 app.include_router(stock_router)
-app.include_router(agent_router)
\ No newline at end of file
+app.include_router(agent_router)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("app:app", host="0.0.0.0", port=4000, loop="uvloop", http="httptools")
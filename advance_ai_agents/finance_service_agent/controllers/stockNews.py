@@ -1,8 +1,10 @@
 import finnhub
-import time
-import requests
 import dotenv 
 import os
+from fastapi import HTTPException
+from fastapi_cache.decorator import cache
+from utils.redisCache import MsgPackCoder
+from utils.httpSession import mount_pooled_adapter
 
 dotenv.load_dotenv()
 
@@ -11,16 +13,15 @@ NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 if not NEWS_API_KEY:
     raise ValueError("Please provide a NEWS API key")
 
-session = requests.Session()
-session.headers.update({
-    "User-Agent": "Chrome/122.0.0.0"
-})
+# finnhub keeps the API token on its own session, so pool that session
+# instead of swapping in a shared one
+FINNHUB_CLIENT = finnhub.Client(api_key=NEWS_API_KEY)
+mount_pooled_adapter(FINNHUB_CLIENT._session)
+
+@cache(expire=60, namespace="news", coder=MsgPackCoder)
 def fetch_news():
     try:
-
-        finnhub_client = finnhub.Client(api_key=NEWS_API_KEY)
-
-        news_list =finnhub_client.general_news('general', min_id=4)
+        news_list =FINNHUB_CLIENT.general_news('general', min_id=4)
         news_stack=[]
         for news in news_list[:10]:
             news_stack.append([news['headline'],news['url']])
@@ -28,4 +29,5 @@ def fetch_news():
         return news_stack
     except Exception as e:
         print(f"❌ Error fetching news: {e}")
-    time.sleep(5)
\ No newline at end of file
+        # Raise instead of returning None so the failure isn't cached
+        raise HTTPException(status_code=502, detail="Error fetching news") from e
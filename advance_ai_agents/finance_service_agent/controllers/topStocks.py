@@ -1,56 +1,62 @@
+import asyncio
 import yfinance as yf
-import requests 
-import time
-session = requests.Session()
-session.headers.update({
-    "User-Agent": "Chrome/122.0.0.0"
-})
+from fastapi import HTTPException
+from fastapi_cache.decorator import cache
+from utils.redisCache import MsgPackCoder
 
-def get_top_stock_info():
-    tickers_list = [
-        "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA", "META", "BRK-B", "JPM", 
-        "JNJ", "V", "PG", "UNH", "MA", "HD", "XOM", "PFE", "NFLX", "DIS", "PEP",
-        "KO", "CSCO", "INTC", "ORCL", "CRM", "NKE", "WMT", "BA", "CVX", "T", "UL",
-        "IBM", "AMD"
-    ]
+_TICKERS = (
+    "AAPL", "MSFT", "GOOGL", "AMZN", "NVDA", "TSLA", "META", "BRK-B", "JPM",
+    "JNJ", "V", "PG", "UNH", "MA", "HD", "XOM", "PFE", "NFLX", "DIS", "PEP",
+    "KO", "CSCO", "INTC", "ORCL", "CRM", "NKE", "WMT", "BA", "CVX", "T", "UL",
+    "IBM", "AMD"
+)
+
+def _fetch_stock_info(tickers, stock):
+    info = tickers.tickers[stock].info
+    return {
+        'symbol': stock,
+        'name': info.get('shortName', 'N/A'),
+        'currentPrice': info.get('currentPrice', 'N/A'),
+        'previousClose': info.get('previousClose', 'N/A'),
+        'sector': info.get('sector', 'N/A')
+    }
+
+@cache(expire=30, namespace="top-stocks", coder=MsgPackCoder)
+async def get_top_stock_info():
     stock_data = []
     try:
-        data = yf.download(tickers_list, period="2d", interval="1d", group_by='ticker', auto_adjust=True)
-        changes = []
-
-        for ticker in tickers_list:
-            try:
-                close_prices = data[ticker]['Close']
-                percent_change = ((close_prices.iloc[-1] - close_prices.iloc[-2]) / close_prices.iloc[-2]) * 100
-                changes.append((ticker, round(percent_change, 2)))
-            except Exception:
-                continue
+        data = await asyncio.to_thread(
+            yf.download, _TICKERS, period="2d", interval="1d", group_by='ticker', auto_adjust=True
+        )
+        # Percent change for every ticker in one vectorized pass
+        closes = data.xs('Close', axis=1, level=1)
+        changes = ((closes.iloc[-1] - closes.iloc[-2]) / closes.iloc[-2] * 100).round(2).dropna()
 
         # Sort by absolute percent change and pick top 5
-        top_5_tickers = [ticker for ticker, _ in sorted(changes, key=lambda x: abs(x[1]), reverse=True)[:5]]
+        top_5_tickers = changes.abs().nlargest(5).index.tolist()
         tickers = yf.Tickers(top_5_tickers)
-        while top_5_tickers:
-            try:
-                stock = top_5_tickers.pop()
-                info = tickers.tickers[stock].info
-                stock_info = {
-                    'symbol': stock,
-                    'name': info.get('shortName', 'N/A'),
-                    'currentPrice': info.get('currentPrice', 'N/A'),
-                    'previousClose': info.get('previousClose', 'N/A'),
-                    'sector': info.get('sector', 'N/A')
-                }
-                stock_data.append(stock_info)
-            except Exception as e:
-                print(f"⚠️ Could not fetch info for {stock}: {e}")
-        
-        print("✅ Data fetching done successfully!")
-        return stock_data
-
+        # Each .info lookup is its own HTTPS round-trip, so fetch them concurrently
+        results = await asyncio.gather(
+            *[asyncio.to_thread(_fetch_stock_info, tickers, stock) for stock in top_5_tickers],
+            return_exceptions=True
+        )
+        for stock, result in zip(top_5_tickers, results):
+            if isinstance(result, Exception):
+                print(f"⚠️ Could not fetch info for {stock}: {result}")
+            else:
+                stock_data.append(result)
     except Exception as e:
         print(f"❌ Error fetching stock data: {e}")
-        return []
+        # Raise instead of returning [] so the failure isn't cached
+        raise HTTPException(status_code=502, detail="Error fetching stock data") from e
+
+    if not stock_data:
+        raise HTTPException(status_code=502, detail="Error fetching stock data")
+
+    print("✅ Data fetching done successfully!")
+    return stock_data
 
+@cache(expire=15, namespace="stock", coder=MsgPackCoder)
 def get_stock(symbol):
     try:
         stock = yf.Ticker(symbol)
@@ -66,4 +72,5 @@ def get_stock(symbol):
         return stock_info
     except Exception as e:
         print(f"❌ Error fetching {symbol}: {e}")
-        time.sleep(5)
+        # Raise instead of returning None so the failure isn't cached
+        raise HTTPException(status_code=502, detail=f"Error fetching {symbol}") from e
@@ -24,15 +24,8 @@ async def read_root(request: Request):
 
 
 @router.get("/top-stocks")
-async def read_top_stocks(request: Request, cache: RedisBackend = Depends(get_cache)):
-    cache_key = "top_stocks"
-    cached_result = await cache.get(cache_key)
-    
-    if cached_result:
-        result = json.loads(cached_result)
-    else:
-        result = get_top_stock_info()
-        await cache.set(cache_key, json.dumps(result), 10)
+async def read_top_stocks(request: Request):
+    result = await get_top_stock_info()
     
     # Check if request is from a browser
     accept_header = request.headers.get("accept", "")
@@ -51,15 +44,8 @@ async def read_top_stocks(request: Request, cache: RedisBackend = Depends(get_ca
     return result
 
 @router.get("/stock-news")
-async def stock_news(request: Request, cache: RedisBackend = Depends(get_cache)):
-    cache_key = "stock_news"
-    cached_result = await cache.get(cache_key)
-    
-    if cached_result:
-        result = json.loads(cached_result)
-    else:
-        result = fetch_news()
-        await cache.set(cache_key, json.dumps(result), 300)
+async def stock_news(request: Request):
+    result = await fetch_news()
     
     # Check if request is from a browser
     accept_header = request.headers.get("accept", "")
@@ -78,16 +64,8 @@ async def stock_news(request: Request, cache: RedisBackend = Depends(get_cache))
     return result
 
 @router.get("/stock/{symbol}")
-async def read_stock(request: Request, symbol: str, cache: RedisBackend = Depends(get_cache)):
-    # Use f-string to properly interpolate the symbol variable
-    cache_key = f"stock_{symbol}"
-    cached_result = await cache.get(cache_key)
-    
-    if cached_result:
-        result = json.loads(cached_result)
-    else:
-        result = get_stock(symbol)
-        await cache.set(cache_key, json.dumps(result), 10)
+async def read_stock(request: Request, symbol: str):
+    result = await get_stock(symbol)
     
     # Check if request is from a browser
     accept_header = request.headers.get("accept", "")
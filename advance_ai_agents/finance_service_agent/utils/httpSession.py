@@ -0,0 +1,19 @@
+import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+
+def create_adapter():
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+
+def mount_pooled_adapter(session):
+    adapter = create_adapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -2,9 +2,11 @@ from fastapi_cache.backends.redis import RedisBackend
 from contextlib import asynccontextmanager
 from redis import asyncio as aioredis
 from fastapi_cache import FastAPICache
+from fastapi_cache.coder import Coder
 from fastapi import FastAPI
 import os
 import dotenv
+import msgpack
 
 dotenv.load_dotenv()
 
@@ -15,7 +17,8 @@ async def lifespan(_: FastAPI):
     redis_client = None  
 
     try:
-        redis_client = aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
+        # Keep raw bytes so binary (msgpack) payloads round-trip intact
+        redis_client = aioredis.from_url(REDIS_URL)
         FastAPICache.init(RedisBackend(redis_client), prefix="fastapi-cache")
         print("✅ Redis cache initialized successfully!")
         yield
@@ -32,5 +35,16 @@ async def lifespan(_: FastAPI):
         except Exception as e:
             print(f"❌ Error while closing Redis: {e}")
 
+class MsgPackCoder(Coder):
+    """Compact binary encoding for cached stock payloads."""
+
+    @classmethod
+    def encode(cls, value):
+        return msgpack.packb(value, use_bin_type=True)
+
+    @classmethod
+    def decode(cls, value):
+        return msgpack.unpackb(value, raw=False)
+
 def get_cache():
     return FastAPICache.get_backend()
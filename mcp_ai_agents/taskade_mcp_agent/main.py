@@ -1,5 +1,7 @@
 import asyncio
+import concurrent.futures
 import os
+import threading
 import streamlit as st
 from textwrap import dedent
 from agno.agent import Agent
@@ -9,8 +11,6 @@ from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 from dotenv import load_dotenv
 
-load_dotenv()
-
 # Page config
 st.set_page_config(
     page_title="Taskade MCP Agent",
@@ -18,6 +18,15 @@ st.set_page_config(
     layout="wide",
 )
 
+
+@st.cache_resource(show_spinner=False)
+def _load_env() -> None:
+    """Read .env once per process rather than on every Streamlit rerun."""
+    load_dotenv()
+
+
+_load_env()
+
 # Title and description
 st.title("Taskade MCP Agent")
 st.markdown(
@@ -57,6 +66,19 @@ with st.sidebar:
         "- [Taskade AI Agents](https://taskade.com/agents)\n"
     )
 
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return a process-wide event loop running in a background thread.
+
+    Keeping the loop running between clicks lets MCP sessions stay alive
+    across reruns instead of stalling whenever no query is in progress.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return loop
+
+
 # Query type selector
 col1, col2 = st.columns([3, 1])
 with col1:
@@ -89,10 +111,138 @@ query = st.text_area(
 )
 
 
-async def run_taskade_agent(message: str) -> str:
+# Shut the MCP server down after this long without queries
+MCP_IDLE_TIMEOUT_SECONDS = 10 * 60
+# Give up on a query after this long so a dead session can't hang the page
+MCP_QUERY_TIMEOUT_SECONDS = 5 * 60
+
+TASKADE_INSTRUCTIONS = dedent("""\
+    You are a Taskade workspace assistant. Help users manage
+    their projects, tasks, and workflows on Taskade.
+
+    - Provide organized, concise information about projects and tasks
+    - Use markdown formatting and tables for readability
+    - When listing tasks, include their status and any due dates
+    - For project operations, confirm actions before making changes
+    - Include links to Taskade resources when helpful
+    - Be helpful and proactive in suggesting workspace improvements
+""")
+
+
+class TaskadeSession:
+    """A Taskade MCP server session kept open across Streamlit reruns.
+
+    Starting `npx @taskade/mcp-server` and the MCP handshake costs seconds, so
+    one background task owns the stdio client and agent and serves queries
+    from a queue until it is closed.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        taskade_api_key: str,
+        nebius_api_key: str,
+    ):
+        self.loop = loop
+        self.keys = (taskade_api_key, nebius_api_key)
+        self._requests: asyncio.Queue = asyncio.Queue()
+        self._task = None
+
+    @property
+    def closed(self) -> bool:
+        return self._task is not None and self._task.done()
+
+    def close(self) -> None:
+        """Ask the background task to shut the MCP server down."""
+        self.loop.call_soon_threadsafe(self._requests.put_nowait, None)
+
+    async def run(self, message: str) -> str:
+        # Checked on the loop thread: the server may have idled out after the
+        # script thread decided to reuse this session
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._serve())
+        future = asyncio.get_running_loop().create_future()
+        await self._requests.put((message, future))
+        return await future
+
+    async def _serve(self) -> None:
+        taskade_api_key, nebius_api_key = self.keys
+        try:
+            server_params = StdioServerParameters(
+                command="npx",
+                args=["-y", "@taskade/mcp-server"],
+                env={
+                    "TASKADE_API_KEY": taskade_api_key,
+                },
+            )
+
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    mcp_tools = MCPTools(session=session)
+                    await mcp_tools.initialize()
+
+                    agent = Agent(
+                        tools=[mcp_tools],
+                        instructions=TASKADE_INSTRUCTIONS,
+                        markdown=True,
+                        show_tool_calls=True,
+                        model=Nebius(
+                            id="Qwen/Qwen3-30B-A3B",
+                            api_key=nebius_api_key,
+                        ),
+                    )
+
+                    while True:
+                        # Shut the server down once nobody has queried it for a
+                        # while, so abandoned browser sessions don't leak it
+                        try:
+                            request = await asyncio.wait_for(
+                                self._requests.get(), MCP_IDLE_TIMEOUT_SECONDS
+                            )
+                        except asyncio.TimeoutError:
+                            return
+                        if request is None:
+                            return
+
+                        message, future = request
+                        # The caller may have timed out and cancelled the query
+                        if future.done():
+                            continue
+                        try:
+                            response = await agent.arun(message)
+                        except Exception as e:
+                            if not future.done():
+                                future.set_exception(e)
+                        else:
+                            if not future.done():
+                                future.set_result(response.content)
+        except Exception as e:
+            self._fail_pending(e)
+        finally:
+            self._fail_pending(RuntimeError("Taskade MCP session closed, please retry."))
+
+    def _fail_pending(self, error: Exception) -> None:
+        while not self._requests.empty():
+            request = self._requests.get_nowait()
+            if request is not None and not request[1].done():
+                request[1].set_exception(error)
+
+
+def get_taskade_session() -> TaskadeSession:
+    """Return this browser session's Taskade MCP session, (re)starting it if needed."""
+    keys = (os.getenv("TASKADE_API_KEY"), os.getenv("NEBIUS_API_KEY"))
+    session = st.session_state.get("taskade_session")
+    if session is None or session.closed or session.keys != keys:
+        if session is not None:
+            session.close()
+        session = TaskadeSession(get_event_loop(), *keys)
+        st.session_state.taskade_session = session
+    return session
+
+
+async def run_taskade_agent(session: TaskadeSession, message: str) -> str:
     """Run the Taskade MCP agent with the given message."""
-    taskade_api_key = os.getenv("TASKADE_API_KEY")
-    nebius_api_key = os.getenv("NEBIUS_API_KEY")
+    taskade_api_key, nebius_api_key = session.keys
 
     if not taskade_api_key:
         return "Error: Taskade API key not provided. Please enter it in the sidebar."
@@ -100,43 +250,7 @@ async def run_taskade_agent(message: str) -> str:
         return "Error: Nebius API key not provided. Please enter it in the sidebar."
 
     try:
-        server_params = StdioServerParameters(
-            command="npx",
-            args=["-y", "@taskade/mcp-server"],
-            env={
-                "TASKADE_API_KEY": taskade_api_key,
-            },
-        )
-
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                mcp_tools = MCPTools(session=session)
-                await mcp_tools.initialize()
-
-                agent = Agent(
-                    tools=[mcp_tools],
-                    instructions=dedent("""\
-                        You are a Taskade workspace assistant. Help users manage
-                        their projects, tasks, and workflows on Taskade.
-
-                        - Provide organized, concise information about projects and tasks
-                        - Use markdown formatting and tables for readability
-                        - When listing tasks, include their status and any due dates
-                        - For project operations, confirm actions before making changes
-                        - Include links to Taskade resources when helpful
-                        - Be helpful and proactive in suggesting workspace improvements
-                    """),
-                    markdown=True,
-                    show_tool_calls=True,
-                    model=Nebius(
-                        id="Qwen/Qwen3-30B-A3B",
-                        api_key=nebius_api_key,
-                    ),
-                )
-
-                response = await agent.arun(message)
-                return response.content
-
+        return await session.run(message)
     except Exception as e:
         return f"Error: {str(e)}"
 
@@ -152,7 +266,15 @@ if st.button("Run Query", type="primary", use_container_width=True):
     else:
         with st.spinner("Connecting to Taskade..."):
             try:
-                result = asyncio.run(run_taskade_agent(query))
+                future = asyncio.run_coroutine_threadsafe(
+                    run_taskade_agent(get_taskade_session(), query),
+                    get_event_loop(),
+                )
+                try:
+                    result = future.result(timeout=MCP_QUERY_TIMEOUT_SECONDS)
+                except concurrent.futures.TimeoutError:
+                    future.cancel()
+                    raise RuntimeError("Taskade query timed out, please retry.")
                 st.markdown("### Results")
                 st.markdown(result)
             except Exception as e:
@@ -3,6 +3,7 @@ AI Consultant Agent with Memori
 Streamlit interface for AI readiness assessment + memory-powered follow-ups.
 """
 
+import asyncio
 import os
 import base64
 
@@ -13,10 +14,13 @@ from openai import OpenAI
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
-from workflow import CompanyProfile, run_ai_assessment
-
-# Load environment variables
-load_dotenv()
+from workflow import (
+    CompanyProfile,
+    cache_assessment,
+    get_cached_assessment,
+    prepare_ai_assessment,
+    stream_ai_assessment,
+)
 
 # Page config
 st.set_page_config(
@@ -25,6 +29,15 @@ st.set_page_config(
 )
 
 
+@st.cache_resource(show_spinner=False)
+def _load_env() -> None:
+    """Read .env once per process rather than on every Streamlit rerun."""
+    load_dotenv()
+
+
+_load_env()
+
+
 def _load_inline_image(path: str, height_px: int) -> str:
     """Return an inline <img> tag for a local PNG, or empty string on failure."""
     try:
@@ -253,11 +266,12 @@ with tab1:
     run_assessment = st.button("📊 Run AI Assessment", type="primary")
 
     if run_assessment:
-        if not company_name or not industry:
+        # from_form skips validation, so required text is checked here
+        if not company_name.strip() or not industry.strip():
             st.error("Please provide at least a company name and industry.")
         else:
             try:
-                profile = CompanyProfile(
+                profile = CompanyProfile.from_form(
                     company_name=company_name.strip(),
                     industry=industry.strip(),
                     company_size=company_size,
@@ -272,23 +286,40 @@ with tab1:
             except Exception as e:
                 st.error(f"Invalid configuration: {e}")
             else:
-                with st.spinner("🤖 Running AI assessment (research + reasoning)..."):
-                    try:
-                        assessment_markdown, _snippets = run_ai_assessment(
-                            profile, st.session_state.openai_client
+                try:
+                    cached = get_cached_assessment(profile)
+                    if cached is not None:
+                        # Same profile assessed recently, skip research + LLM
+                        assessment_markdown, _snippets = cached
+                        st.markdown(
+                            f"## 🧾 AI Readiness & Cost Assessment for *{profile.company_name}*"
                         )
-                        st.session_state.assessment_markdown = assessment_markdown
-                        st.session_state.company_profile = profile
+                        st.markdown(assessment_markdown)
+                    else:
+                        with st.spinner("🔎 Researching AI case studies..."):
+                            messages, snippets = asyncio.run(
+                                prepare_ai_assessment(
+                                    profile, st.session_state.openai_client
+                                )
+                            )
 
                         st.markdown(
                             f"## 🧾 AI Readiness & Cost Assessment for *{profile.company_name}*"
                         )
-                        st.markdown(assessment_markdown)
+                        # Render the report as it is generated
+                        assessment_markdown = st.write_stream(
+                            stream_ai_assessment(
+                                messages, st.session_state.openai_client
+                            )
+                        )
+                        cache_assessment(profile, assessment_markdown, snippets)
+                    st.session_state.assessment_markdown = assessment_markdown
+                    st.session_state.company_profile = profile
 
-                        # With Memori v3, conversations are captured automatically
-                        # via the registered OpenAI client, so no manual recording here.
-                    except Exception as e:
-                        st.error(f"❌ Error during assessment: {e}")
+                    # With Memori v3, conversations are captured automatically
+                    # via the registered OpenAI client, so no manual recording here.
+                except Exception as e:
+                    st.error(f"❌ Error during assessment: {e}")
 
     # Show last assessment if available and we didn't just run a new one
     if st.session_state.assessment_markdown and not run_assessment:
@@ -3,8 +3,14 @@ AI Consultant Workflow
 Uses LangChain for reasoning and Tavily for web/case-study research.
 """
 
+import asyncio
 import os
-from typing import List, Optional, Tuple, Any
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 
 from dotenv import load_dotenv
 from tavily import TavilyClient
@@ -52,6 +58,16 @@ class CompanyProfile(BaseModel):
         description="Free-text context: constraints, data sources, regulatory considerations, etc.",
     )
 
+    @classmethod
+    def from_form(cls, **fields: Any) -> "CompanyProfile":
+        """
+        Build a profile from the Streamlit form without re-running validation.
+
+        Only for inputs the UI already constrains (fixed select options, required
+        text checked by the caller); use the normal constructor for anything else.
+        """
+        return cls.model_construct(**fields)
+
 
 class ResearchSnippet(BaseModel):
     """Single Tavily search result distilled for prompting."""
@@ -91,14 +107,62 @@ def search_ai_case_studies_with_tavily(
     if not tavily_key:
         raise RuntimeError("TAVILY_API_KEY not set in environment variables")
 
-    client = TavilyClient(api_key=tavily_key)
     query = _build_research_query(profile)
+    return list(_search_once_in_flight(query, max_results, tavily_key))
+
+
+# Searches currently running, so concurrent identical assessments share one call
+_inflight_searches: Dict[Tuple[str, int], "Future[Tuple[ResearchSnippet, ...]]"] = {}
+_inflight_lock = threading.Lock()
+
+
+def _search_once_in_flight(
+    query: str, max_results: int, tavily_key: str
+) -> Tuple[ResearchSnippet, ...]:
+    """Join an identical search that is already running instead of starting another."""
+    key = (query, max_results)
+    with _inflight_lock:
+        future = _inflight_searches.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight_searches[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = _cached_search(query, max_results, tavily_key)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight_searches.pop(key, None)
+
+
+@lru_cache(maxsize=4)
+def _tavily_client(tavily_key: str) -> TavilyClient:
+    """Reuse one Tavily client per API key instead of building one per search."""
+    return TavilyClient(api_key=tavily_key)
+
+
+@lru_cache(maxsize=256)
+def _cached_search(
+    query: str, max_results: int, tavily_key: str
+) -> Tuple[ResearchSnippet, ...]:
+    """Run a Tavily search once per distinct query; failures are not cached."""
+    client = _tavily_client(tavily_key)
 
     try:
-        # Use advanced depth to get richer snippets; return up to max_results
+        # Use advanced depth to get richer snippets; return up to max_results.
+        # Two chunks per source (~1k chars) cover the 800 chars we keep.
         results = client.search(
             query=query,
             search_depth="advanced",
+            chunks_per_source=2,
             max_results=max_results,
             include_answer=False,
             include_raw_content=False,
@@ -106,64 +170,55 @@ def search_ai_case_studies_with_tavily(
     except Exception as e:
         raise RuntimeError(f"Error calling Tavily: {e}") from e
 
-    snippets: List[ResearchSnippet] = []
-    for r in results.get("results", []):
-        title = (r.get("title") or "AI case study").strip()
-        url = r.get("url") or ""
-        text = (r.get("content") or r.get("snippet") or "").strip()
-        snippet_text = text[:800] if text else ""
-        if not (title or url or snippet_text):
-            continue
-        snippets.append(
-            ResearchSnippet(
-                title=title,
-                url=url,
-                snippet=snippet_text,
-            )
+    # Fields come straight from the Tavily response as strings, so skip
+    # validation. The text is bounded before stripping so long contents
+    # aren't copied whole.
+    return tuple(
+        ResearchSnippet.model_construct(
+            title=(r.get("title") or "AI case study").strip(),
+            url=r.get("url") or "",
+            snippet=(r.get("content") or r.get("snippet") or "")[:2048].strip()[:800],
         )
+        for r in results.get("results", [])
+        if r.get("title") or r.get("url") or r.get("content") or r.get("snippet")
+    )
 
-    return snippets
 
+CONSULTANT_MODEL = "gpt-4o-mini"
 
-def run_ai_assessment(
-    profile: CompanyProfile, openai_client: Any
-) -> Tuple[str, List[ResearchSnippet]]:
-    """
-    Main workflow:
-    - Pull a few relevant case studies via Tavily.
-    - Ask the LLM (LangChain-compatible) to produce a structured consulting report.
+SYSTEM_PROMPT = (
+    "You are a senior AI transformation consultant. "
+    "You give pragmatic, business-focused advice about whether and how a company "
+    "should adopt AI, including costs, risks, and change management."
+)
 
-    Returns:
-        assessment_markdown: str  -> Markdown report for display.
-        research_snippets: List[ResearchSnippet] -> For optional debugging / display.
-    """
-    # Step 1: web research
-    research_snippets = search_ai_case_studies_with_tavily(profile, max_results=5)
+USER_PROMPT_TEMPLATE = (
+    "{profile_section}"
+    "Relevant AI adoption / case-study research:\n"
+    "{research_section}\n\n"
+    "Task:\n"
+    "1. Decide whether they should integrate AI now, later, or not at all. Be explicit.\n"
+    "2. Recommend specific AI use cases, grouped by area (workforce, internal tools, ecosystem, etc.).\n"
+    "3. Provide rough cost bands (e.g. '<$50k', '$50k-$250k', '$250k-$1M', '>$1M') and key cost drivers.\n"
+    "4. Call out major risks, dependencies, and change-management considerations.\n"
+    "5. Summarize concrete next steps the company should take in the next 30–90 days.\n\n"
+    "Respond in clear Markdown with the following sections and nothing else:\n"
+    "## Recommendation\n"
+    "## Priority AI Use Cases\n"
+    "## Cost & Complexity\n"
+    "## Risks & Considerations\n"
+    "## Next Steps\n"
+)
 
-    # Step 2: build prompt for the consultant LLM
-    research_section = ""
-    if research_snippets:
-        lines: List[str] = []
-        for i, s in enumerate(research_snippets, start=1):
-            lines.append(f"{i}. {s.title} ({s.url})\n" f"{s.snippet}\n")
-        research_section = "\n".join(lines)
-    else:
-        research_section = (
-            "No external case studies were found. Rely on your general knowledge."
-        )
 
+def _build_profile_section(profile: CompanyProfile) -> str:
+    """Render the company profile block of the consultant prompt."""
     goals_str = ", ".join(profile.goals) if profile.goals else "Not specified"
     areas_str = (
         ", ".join(profile.ai_focus_areas) if profile.ai_focus_areas else "Not specified"
     )
 
-    system_prompt = (
-        "You are a senior AI transformation consultant. "
-        "You give pragmatic, business-focused advice about whether and how a company "
-        "should adopt AI, including costs, risks, and change management."
-    )
-
-    user_prompt = (
+    return (
         f"Company profile:\n"
         f"- Name: {profile.company_name}\n"
         f"- Industry: {profile.industry}\n"
@@ -175,32 +230,178 @@ def run_ai_assessment(
         f"- Budget range: {profile.budget_range}\n"
         f"- Time horizon: {profile.time_horizon}\n"
         f"- Additional notes: {profile.notes or 'None'}\n\n"
-        f"Relevant AI adoption / case-study research:\n"
-        f"{research_section}\n\n"
-        "Task:\n"
-        "1. Decide whether they should integrate AI now, later, or not at all. Be explicit.\n"
-        "2. Recommend specific AI use cases, grouped by area (workforce, internal tools, ecosystem, etc.).\n"
-        "3. Provide rough cost bands (e.g. '<$50k', '$50k-$250k', '$250k-$1M', '>$1M') and key cost drivers.\n"
-        "4. Call out major risks, dependencies, and change-management considerations.\n"
-        "5. Summarize concrete next steps the company should take in the next 30–90 days.\n\n"
-        "Respond in clear Markdown with the following sections and nothing else:\n"
-        "## Recommendation\n"
-        "## Priority AI Use Cases\n"
-        "## Cost & Complexity\n"
-        "## Risks & Considerations\n"
-        "## Next Steps\n"
     )
 
+
+# Finished assessments, reused when the same profile is submitted again
+ASSESSMENT_CACHE_TTL_SECONDS = 7 * 24 * 3600
+ASSESSMENT_CACHE_SIZE = 256
+_assessment_cache: "OrderedDict[Tuple, Tuple[float, str, Tuple[ResearchSnippet, ...]]]" = (
+    OrderedDict()
+)
+_assessment_cache_lock = threading.Lock()
+
+
+def _normalize(value: Optional[str]) -> str:
+    return " ".join((value or "").lower().split())
+
+
+def _assessment_cache_key(profile: CompanyProfile) -> Tuple:
+    """Key a profile by its content, ignoring case, spacing and list order."""
+    return (
+        _normalize(profile.company_name),
+        _normalize(profile.industry),
+        _normalize(profile.company_size),
+        _normalize(profile.region),
+        _normalize(profile.tech_maturity),
+        tuple(sorted(_normalize(g) for g in profile.goals)),
+        tuple(sorted(_normalize(a) for a in profile.ai_focus_areas)),
+        _normalize(profile.budget_range),
+        _normalize(profile.time_horizon),
+        _normalize(profile.notes),
+    )
+
+
+def get_cached_assessment(
+    profile: CompanyProfile,
+) -> Optional[Tuple[str, List[ResearchSnippet]]]:
+    """Return a previous assessment for an equivalent profile, if still fresh."""
+    key = _assessment_cache_key(profile)
+    with _assessment_cache_lock:
+        entry = _assessment_cache.get(key)
+        if entry is None:
+            return None
+        created_at, assessment_markdown, research_snippets = entry
+        if time.monotonic() - created_at > ASSESSMENT_CACHE_TTL_SECONDS:
+            del _assessment_cache[key]
+            return None
+        _assessment_cache.move_to_end(key)
+    return assessment_markdown, list(research_snippets)
+
+
+def cache_assessment(
+    profile: CompanyProfile,
+    assessment_markdown: str,
+    research_snippets: List[ResearchSnippet],
+) -> None:
+    """Remember a finished assessment for `get_cached_assessment`."""
+    if not assessment_markdown:
+        return
+    key = _assessment_cache_key(profile)
+    with _assessment_cache_lock:
+        _assessment_cache[key] = (
+            time.monotonic(),
+            assessment_markdown,
+            tuple(research_snippets),
+        )
+        _assessment_cache.move_to_end(key)
+        while len(_assessment_cache) > ASSESSMENT_CACHE_SIZE:
+            _assessment_cache.popitem(last=False)
+
+
+def _warm_up_llm_connection(openai_client: Any) -> None:
+    """Open a pooled connection to the LLM API ahead of the completion call."""
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
+        openai_client.models.list()
+    except Exception:
+        # Best effort only; the completion call reports any real problem
+        pass
+
+
+async def prepare_ai_assessment(
+    profile: CompanyProfile, openai_client: Any = None
+) -> Tuple[List[Dict[str, str]], List[ResearchSnippet]]:
+    """
+    Pull a few relevant case studies via Tavily and build the chat messages
+    for the consultant LLM.
+
+    The search runs in a worker thread while the profile part of the prompt
+    is built. When `openai_client` is given, its connection to the LLM API is
+    warmed up in parallel so the completion call doesn't pay for the TCP/TLS
+    handshake after the research finishes.
+
+    Returns:
+        messages: List[Dict[str, str]] -> System + user messages for the LLM.
+        research_snippets: List[ResearchSnippet] -> For optional debugging / display.
+    """
+    # Step 1: web research, overlapped with prompt preparation
+    research_task = asyncio.create_task(
+        asyncio.to_thread(search_ai_case_studies_with_tavily, profile, 5)
+    )
+    warm_up_task = (
+        asyncio.create_task(asyncio.to_thread(_warm_up_llm_connection, openai_client))
+        if openai_client is not None
+        else None
+    )
+    profile_section = _build_profile_section(profile)
+    research_snippets = await research_task
+    if warm_up_task is not None:
+        await warm_up_task
+
+    # Step 2: build prompt for the consultant LLM
+    research_section = (
+        "\n".join(
+            f"{i}. {s.title} ({s.url})\n{s.snippet}\n"
+            for i, s in enumerate(research_snippets, start=1)
         )
+        if research_snippets
+        else "No external case studies were found. Rely on your general knowledge."
+    )
+
+    user_prompt = USER_PROMPT_TEMPLATE.format(
+        profile_section=profile_section, research_section=research_section
+    )
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+    return messages, research_snippets
+
+
+def stream_ai_assessment(
+    messages: List[Dict[str, str]], openai_client: Any
+) -> Iterator[str]:
+    """
+    Yield the consultant report piece by piece as the LLM generates it, so the
+    UI can render it with `st.write_stream` instead of waiting for the whole
+    response.
+    """
+    try:
+        stream = openai_client.chat.completions.create(
+            model=CONSULTANT_MODEL,
+            messages=messages,
+            stream=True,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
     except Exception as e:
         raise RuntimeError(f"Error calling consultant LLM: {e}") from e
 
-    assessment_markdown = response.choices[0].message.content
+
+async def run_ai_assessment(
+    profile: CompanyProfile, openai_client: Any
+) -> Tuple[str, List[ResearchSnippet]]:
+    """
+    Main workflow:
+    - Pull a few relevant case studies via Tavily.
+    - Ask the LLM (LangChain-compatible) to produce a structured consulting report.
+
+    Thin non-streaming wrapper over `prepare_ai_assessment` +
+    `stream_ai_assessment`.
+    Results are cached per profile, see `get_cached_assessment`.
+
+    Returns:
+        assessment_markdown: str  -> Markdown report for display.
+        research_snippets: List[ResearchSnippet] -> For optional debugging / display.
+    """
+    cached = get_cached_assessment(profile)
+    if cached is not None:
+        return cached
+
+    messages, research_snippets = await prepare_ai_assessment(profile, openai_client)
+    assessment_markdown = await asyncio.to_thread(
+        "".join, stream_ai_assessment(messages, openai_client)
+    )
+    cache_assessment(profile, assessment_markdown, research_snippets)
     return assessment_markdown, research_snippets
@@ -6,20 +6,27 @@ Conversational interface with Memori for contextual conversations
 import os
 import base64
 import streamlit as st
-from memori import Memori
 from dotenv import load_dotenv
-import json
-from typing import List
+import queue
+import sqlite3
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from workflow import (
     get_google_news_page_urls,
     scrape_news_pages,
     get_best_news_urls,
     scrape_news_articles,
     process_news_list,
+    load_cached_analysis,
+    save_cached_analysis,
     Config,
 )
 from agno.models.nebius import Nebius
 from agno.agent import Agent
+from agno.run.agent import RunEvent
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 # Load environment variables
 load_dotenv()
@@ -30,28 +37,31 @@ st.set_page_config(
     layout="wide",
 )
 
-# Inline title with Memori and Bright Data PNG logos
-try:
-    with open("./assets/Memori_Logo.png", "rb") as f:
-        memori_png_base64 = base64.b64encode(f.read()).decode()
-    memori_img_inline = (
-        f"<img src='data:image/png;base64,{memori_png_base64}' "
-        f"style='height:100px; width:auto; display:inline-block; vertical-align:middle; margin:0 8px;' alt='Memori Logo'>"
-    )
-except Exception:
-    memori_img_inline = ""
-
-try:
-    with open("./assets/brightdata_logo.png", "rb") as f:
-        brightdata_png_base64 = base64.b64encode(f.read()).decode()
-    brightdata_img_inline = (
-        f"<img src='data:image/png;base64,{brightdata_png_base64}' "
-        f"style='height:80px; width:auto; display:inline-block; vertical-align:middle; margin:0 8px;' alt='Bright Data Logo'>"
+
+@st.cache_resource(show_spinner=False)
+def _load_inline_logo(path: str, height_px: int, alt: str) -> str:
+    """Return an inline <img> tag for a local PNG, or empty string on failure."""
+    try:
+        with open(path, "rb") as f:
+            png_base64 = base64.b64encode(f.read()).decode()
+    except Exception:
+        return ""
+    return (
+        f"<img src='data:image/png;base64,{png_base64}' "
+        f"style='height:{height_px}px; width:auto; display:inline-block; vertical-align:middle; margin:0 8px;' alt='{alt}'>"
     )
-except Exception:
-    brightdata_img_inline = ""
 
-title_html = f"""
+
+@st.cache_resource(show_spinner=False)
+def _build_title_html() -> str:
+    """Inline title with Memori and Bright Data PNG logos, built once per process."""
+    memori_img_inline = _load_inline_logo(
+        "./assets/Memori_Logo.png", 100, "Memori Logo"
+    )
+    brightdata_img_inline = _load_inline_logo(
+        "./assets/brightdata_logo.png", 80, "Bright Data Logo"
+    )
+    return f"""
 <div style='display:flex; align-items:center; width:120%; padding:8px 0;'>
   <h1 style='margin:0; padding:0; font-size:2.2rem; font-weight:800; display:flex; align-items:center; gap:10px;'>
     <span>Brand Reputation Monitor with</span>
@@ -60,7 +70,9 @@ title_html = f"""
   </h1>
 </div>
 """
-st.markdown(title_html, unsafe_allow_html=True)
+
+
+st.markdown(_build_title_html(), unsafe_allow_html=True)
 
 # Sidebar
 with st.sidebar:
@@ -122,14 +134,6 @@ nebius_key = os.getenv("NEBIUS_API_KEY", "")
 brightdata_key = os.getenv("BRIGHTDATA_API_KEY", "")
 
 # Initialize session state
-if "messages" not in st.session_state:
-    st.session_state.messages = []
-
-if "conversation_state" not in st.session_state:
-    st.session_state.conversation_state = (
-        "welcome"  # welcome, asked_company, asked_keywords, analyzing, chatting
-    )
-
 if "user_company" not in st.session_state:
     st.session_state.user_company = None
 
@@ -138,13 +142,48 @@ if "search_queries" not in st.session_state:
 
 if "analysis_results" not in st.session_state:
     st.session_state.analysis_results = None
+    # Prompt context derived from analysis_results, see store_analysis_results
+    st.session_state.analysis_context_str = ""
+    st.session_state.analysis_version = 0
 
 if "memori_initialized" not in st.session_state:
     st.session_state.memori_initialized = False
 
+# SQLite settings for Memori's append-heavy chat workload: WAL with
+# synchronous=NORMAL avoids an fsync per ingest, the rest keep hot pages in RAM
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-64000",
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@st.cache_resource(show_spinner=False)
+def register_sqlite_pragmas() -> None:
+    """Apply SQLITE_PRAGMAS to every SQLite connection, once per process."""
+    event.listen(Engine, "connect", _apply_sqlite_pragmas)
+
+
 # Initialize Memori (once)
 if not st.session_state.memori_initialized and nebius_key:
     try:
+        # Imported here so sessions without API keys never load memorisdk
+        from memori import Memori
+
+        register_sqlite_pragmas()
         st.session_state.memori = Memori(
             database_connect="sqlite:///memori.db",
             conscious_ingest=False,
@@ -175,9 +214,316 @@ if not nebius_key or not brightdata_key:
 if "memory_messages" not in st.session_state:
     st.session_state.memory_messages = []
 
+# Maximum number of queued conversations written in one pass of the worker
+INGEST_BATCH_SIZE = 32
+
+
+class MemoriIngestWorker:
+    """Records conversations in Memori on a background thread.
+
+    Conversations are queued so the UI doesn't block on the SQLite write;
+    everything queued while a write is in progress is recorded in the next
+    pass. `generation` increases after every pass so readers can tell when
+    cached search results may be stale.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue = queue.Queue()
+        self.generation = 0
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def put(self, memori, user_input: str, ai_output: str) -> None:
+        self._queue.put((memori, user_input, ai_output))
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < INGEST_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for memori, user_input, ai_output in batch:
+                try:
+                    memori.record_conversation(
+                        user_input=user_input, ai_output=ai_output
+                    )
+                except Exception:
+                    pass  # Silently fail to avoid UI clutter
+            self.generation += 1
+
+
+@st.cache_resource(show_spinner=False)
+def get_ingest_worker() -> MemoriIngestWorker:
+    return MemoriIngestWorker()
+
+
+# Recent Memori search results, keyed by (prompt, limit)
+MEMORI_SEARCH_CACHE_SIZE = 256
+if "memori_search_cache" not in st.session_state:
+    st.session_state.memori_search_cache = OrderedDict()
+    st.session_state.memori_search_generation = get_ingest_worker().generation
+
+
+def memori_search_cached(prompt: str, limit: int) -> tuple:
+    """Search Memori, reusing results for repeated questions until the next ingest."""
+    cache = st.session_state.memori_search_cache
+    generation = get_ingest_worker().generation
+    if st.session_state.memori_search_generation != generation:
+        cache.clear()
+        st.session_state.memori_search_generation = generation
+
+    key = (prompt, limit)
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+
+    results = tuple(st.session_state.memori.search(prompt, limit=limit) or ())
+    cache[key] = results
+    if len(cache) > MEMORI_SEARCH_CACHE_SIZE:
+        cache.popitem(last=False)
+    return results
+
+
+def memori_ingest(user_input: str, ai_output: str) -> None:
+    """Queue a conversation for Memori; cached searches reset once it is stored."""
+    get_ingest_worker().put(st.session_state.memori, user_input, ai_output)
+
+
+# Per-article limits for the analysis context sent with every memory question
+CONTEXT_TITLE_MAX_CHARS = 80
+CONTEXT_SUMMARY_MAX_CHARS = 200
+
+
+def store_analysis_results(company, news_analysis_list) -> None:
+    """Save analysis results and pre-format the context the memory agent uses."""
+    st.session_state.analysis_results = news_analysis_list
+    # Tallied once here so "overall sentiment" questions don't need the model
+    # to count through every article
+    st.session_state.sentiment_counts = Counter(
+        analysis.sentiment_analysis.lower() for analysis in news_analysis_list
+    )
+    sentiment_summary = ", ".join(
+        f"{count} {sentiment}"
+        for sentiment, count in st.session_state.sentiment_counts.most_common()
+    )
+    st.session_state.analysis_context_str = (
+        f"\n\nLatest Analysis Results for {company}:\n"
+        f"Sentiment breakdown: {sentiment_summary}\n"
+        + "".join(
+            f"{i}. {analysis.title[:CONTEXT_TITLE_MAX_CHARS]} - "
+            f"{analysis.sentiment_analysis} - "
+            f"{analysis.summary[:CONTEXT_SUMMARY_MAX_CHARS]}\n"
+            for i, analysis in enumerate(news_analysis_list, 1)
+        )
+        if news_analysis_list
+        else ""
+    )
+    st.session_state.analysis_version += 1
+
+
+def get_followup_agent() -> Agent:
+    """Return the memory-tab agent, rebuilt only when the analysis it describes changes."""
+    key = (
+        st.session_state.user_company,
+        tuple(st.session_state.search_queries or ()),
+        st.session_state.analysis_version,
+    )
+    if st.session_state.get("followup_agent_key") != key:
+        st.session_state.followup_agent = Agent(
+            name="Brand Memory Assistant",
+            description=f"""You answer questions strictly about prior analyses.
+
+Company: {st.session_state.user_company or 'Not specified'}
+Keywords: {', '.join(st.session_state.search_queries) if st.session_state.search_queries else 'Not specified'}
+{st.session_state.analysis_context_str}
+
+If asked outside scope, politely say you only answer about stored analyses.""",
+            model=st.session_state.nebius_model,
+            markdown=True,
+        )
+        st.session_state.followup_agent_key = key
+    return st.session_state.followup_agent
+
+
+def stream_agent_response(agent: Agent, message: str):
+    """Yield the text of an agent run as the model generates it."""
+    for run_event in agent.run(message, stream=True):
+        if run_event.event == RunEvent.run_content and run_event.content:
+            yield str(run_event.content)
+
+
+def run_analysis_pipeline(config: Config, status):
+    """Run search, scraping and LLM analysis, reporting each step on `status`."""
+    status.update(label="📰 Retrieving Google News page URLs…")
+    google_news_page_urls = get_google_news_page_urls(config.search_queries)
+
+    status.update(
+        label=f"🔍 Scraping {len(google_news_page_urls)} Google News page(s)…"
+    )
+    scraped_news_pages = scrape_news_pages(google_news_page_urls)
+
+    status.update(label="🎯 Extracting most relevant news…")
+    news_urls = get_best_news_urls(scraped_news_pages, config.num_news)
+
+    status.update(label=f"📄 Scraping {len(news_urls)} relevant articles…")
+    news_list = scrape_news_articles(news_urls)
+
+    status.update(label="🧠 Analyzing sentiment and insights…")
+    return process_news_list(news_list)
+
+
+@st.cache_resource(show_spinner=False)
+def get_analysis_executor() -> ThreadPoolExecutor:
+    """Worker threads that run analyses off the Streamlit script thread."""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+class AnalysisJob:
+    """A brand analysis running on the analysis executor.
+
+    Worker threads can't draw Streamlit elements, so the job only records the
+    step it is on (`stage`) and the page polls it until `future` is done.
+    """
+
+    def __init__(self, company: str, config: Config, force_refresh: bool):
+        self.company = company
+        self.config = config
+        self.stage = "🔍 Analyzing brand reputation... This may take a few minutes..."
+        self.future = get_analysis_executor().submit(self._run, force_refresh)
+
+    def update(self, label: str) -> None:
+        # Same call shape as st.status(...).update, see run_analysis_pipeline
+        self.stage = label
+
+    def _run(self, force_refresh: bool):
+        config = self.config
+        if not force_refresh:
+            cached_analysis = load_cached_analysis(
+                self.company, config.search_queries, config.num_news
+            )
+            if cached_analysis is not None:
+                self.update(
+                    label="♻️ Reused the analysis of this request from the last 24 hours"
+                )
+                return cached_analysis
+
+        news_analysis_list = run_analysis_pipeline(config, self)
+        save_cached_analysis(
+            self.company, config.search_queries, config.num_news, news_analysis_list
+        )
+        self.update(label=f"✅ Analysis complete! ({len(news_analysis_list)} articles)")
+        return news_analysis_list
+
+
+def finish_analysis_job(job: AnalysisJob) -> None:
+    """Publish a finished job's report to session state and Memori."""
+    try:
+        news_analysis_list = job.future.result()
+    except Exception as e:
+        st.session_state.analysis_notice = None
+        st.session_state.analysis_error = f"❌ Error during analysis: {str(e)}"
+        return
+
+    keywords = job.config.search_queries
+    store_analysis_results(job.company, news_analysis_list)
+    st.session_state.analysis_notice = job.stage
+    st.session_state.analysis_error = None
+    st.session_state.report_markdown = format_report_markdown(
+        job.company, keywords, news_analysis_list
+    )
+
+    # Ingest a concise summary of this run into Memori for Memory Q&A
+    if st.session_state.memori_initialized:
+        summary_text = (
+            f"Report for {job.company} with "
+            f"{len(keywords)} keywords and {len(news_analysis_list)} articles."
+        )
+        memori_ingest(
+            f"Run analysis for {job.company}: {', '.join(keywords)}",
+            summary_text,
+        )
+
+
+def show_analysis_progress() -> None:
+    """Show the running job's current step; publish it once it finishes."""
+    job = st.session_state.get("analysis_job")
+    if job is None:
+        return
+    if not job.future.done():
+        st.status(job.stage, state="running")
+        return
+
+    del st.session_state.analysis_job
+    finish_analysis_job(job)
+    # Full rerun to stop polling and re-enable the Run button
+    st.rerun()
+
+
+SENTIMENT_EMOJI = {
+    "positive": "😊",
+    "negative": "😞",
+    "neutral": "😐",
+}
+
+
+def format_report_markdown(company, keywords, news_analysis_list) -> str:
+    """Render the whole brand reputation report as one Markdown document."""
+    parts = [
+        f"## 📊 Brand Reputation Report for {company}\n\n"
+        f"**Search Keywords:** {', '.join(keywords)}\n\n"
+        "---\n"
+    ]
+    for i, analysis in enumerate(news_analysis_list, 1):
+        sentiment_emoji = SENTIMENT_EMOJI.get(
+            analysis.sentiment_analysis.lower(), "😐"
+        )
+        parts.append(
+            f"### {i}. {analysis.title}\n\n"
+            f"**URL:** {analysis.url}\n\n"
+            f"**Summary:** {analysis.summary}\n\n"
+            f"**Sentiment:** {sentiment_emoji} {analysis.sentiment_analysis.title()}\n\n"
+            "**Key Insights:**\n\n"
+            + "".join(f"- {insight}\n" for insight in analysis.insights)
+            + "\n---\n"
+        )
+    return "\n".join(parts)
+
+
+KEYWORD_BASE_TERMS = (
+    "news",
+    "reviews",
+    "controversy",
+    "announcement",
+    "stock",
+    "earnings",
+    "product launch",
+    "customer feedback",
+    "complaints",
+    "success",
+)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def compute_keyword_suggestions(
+    brand: str, existing: tuple
+) -> tuple[list[str], list[str]]:
+    """Return (suggested keywords for a brand, those already in `existing`)."""
+    if not brand:
+        return [], []
+    suggestions = [f"{brand} {term}" for term in KEYWORD_BASE_TERMS]
+    existing_set = set(existing)
+    preselected = [opt for opt in suggestions if opt in existing_set]
+    return suggestions, preselected
+
+
 tab1, tab2 = st.tabs(["📈 Quick Analysis", "🧠 Memory"])
 
-with tab1:
+
+@st.fragment
+def analysis_tab():
+    """Quick Analysis tab; reruns on its own widgets without the rest of the page."""
     st.markdown("#### Configure Analysis")
 
     col1, col2 = st.columns([2, 1])
@@ -197,29 +543,12 @@ with tab1:
             help="How many top articles to analyze",
         )
 
-    # Suggested keyword options based on company name
-    suggestions = []
-    if st.session_state.user_company:
-        brand = st.session_state.user_company.strip()
-        base_terms = [
-            "news",
-            "reviews",
-            "controversy",
-            "announcement",
-            "stock",
-            "earnings",
-            "product launch",
-            "customer feedback",
-            "complaints",
-            "success",
-        ]
-        suggestions = [f"{brand} {term}" for term in base_terms]
-
-    # Preselect any existing keywords that match suggestions
-    preselected = []
-    if st.session_state.search_queries and suggestions:
-        existing = set(st.session_state.search_queries)
-        preselected = [opt for opt in suggestions if opt in existing]
+    # Suggested keyword options based on company name, preselecting any
+    # existing keywords that match them
+    suggestions, preselected = compute_keyword_suggestions(
+        (st.session_state.user_company or "").strip(),
+        tuple(st.session_state.search_queries or ()),
+    )
 
     selected_suggestions = st.multiselect(
         "Suggested Keywords",
@@ -228,7 +557,12 @@ with tab1:
         help="Pick from auto-generated keywords based on the company name",
     )
 
-    run_analysis = st.button("🔍 Run Analysis", type="primary")
+    job_running = "analysis_job" in st.session_state
+    run_analysis = st.button("🔍 Run Analysis", type="primary", disabled=job_running)
+    force_refresh = st.checkbox(
+        "Force refresh",
+        help="Ignore results cached from an identical analysis in the last 24 hours",
+    )
 
     if run_analysis:
         keywords = [*selected_suggestions]
@@ -240,81 +574,25 @@ with tab1:
             st.error("Please provide at least one keyword")
         else:
             config = Config(search_queries=keywords, num_news=num_news)
-            with st.spinner(
-                "🔍 Analyzing brand reputation... This may take a few minutes..."
-            ):
-                try:
-                    st.write("📰 Retrieving Google News page URLs…")
-                    google_news_page_urls = get_google_news_page_urls(
-                        config.search_queries
-                    )
-                    st.write(
-                        f"✅ Found {len(google_news_page_urls)} Google News page(s)"
-                    )
-
-                    st.write("🔍 Scraping news pages…")
-                    scraped_news_pages = scrape_news_pages(google_news_page_urls)
-                    st.write("✅ News pages scraped!")
-
-                    st.write("🎯 Extracting most relevant news…")
-                    news_urls = get_best_news_urls(scraped_news_pages, config.num_news)
-                    st.write(f"✅ Found {len(news_urls)} relevant articles")
-
-                    st.write("📄 Scraping news articles…")
-                    news_list = scrape_news_articles(news_urls)
-                    st.write("✅ Articles scraped!")
-
-                    st.write("🧠 Analyzing sentiment and insights…")
-                    news_analysis_list = process_news_list(news_list)
-                    st.write("✅ Analysis complete!")
+            # Runs in the background so the page stays responsive meanwhile
+            st.session_state.analysis_job = AnalysisJob(
+                st.session_state.user_company, config, force_refresh
+            )
+            st.rerun()
 
-                    st.session_state.analysis_results = news_analysis_list
+    if job_running:
+        # Poll the background job once a second until it finishes
+        st.fragment(run_every=1)(show_analysis_progress)()
+    elif st.session_state.get("analysis_error"):
+        st.error(st.session_state.analysis_error)
+    elif st.session_state.get("report_markdown"):
+        st.success(st.session_state.analysis_notice)
+        st.markdown(st.session_state.report_markdown)
 
-                    st.markdown(
-                        f"## 📊 Brand Reputation Report for {st.session_state.user_company}"
-                    )
-                    st.markdown(f"**Search Keywords:** {', '.join(keywords)}")
-                    st.markdown("---")
-
-                    for i, analysis in enumerate(news_analysis_list, 1):
-                        sentiment_emoji = {
-                            "positive": "😊",
-                            "negative": "😞",
-                            "neutral": "😐",
-                        }.get(analysis.sentiment_analysis.lower(), "😐")
-
-                        st.markdown(f"### {i}. {analysis.title}")
-                        st.markdown(f"**URL:** {analysis.url}")
-                        st.markdown(f"**Summary:** {analysis.summary}")
-                        st.markdown(
-                            f"**Sentiment:** {sentiment_emoji} {analysis.sentiment_analysis.title()}"
-                        )
-                        st.markdown("**Key Insights:**")
-                        for insight in analysis.insights:
-                            st.markdown(f"- {insight}")
-                        st.markdown("\n---\n")
-
-                    # Ingest a concise summary of this run into Memori for Memory Q&A
-                    if st.session_state.memori_initialized:
-                        try:
-                            from memorisdk import MemoriContext
-
-                            summary_text = (
-                                f"Report for {st.session_state.user_company} with "
-                                f"{len(keywords)} keywords and {len(news_analysis_list)} articles."
-                            )
-                            st.session_state.memori.ingest(
-                                MemoriContext(
-                                    user_input=f"Run analysis for {st.session_state.user_company}: {', '.join(keywords)}",
-                                    assistant_output=summary_text,
-                                )
-                            )
-                        except Exception:
-                            pass
-                except Exception as e:
-                    st.error(f"❌ Error during analysis: {str(e)}")
 
-with tab2:
+@st.fragment
+def memory_tab():
+    """Memory chat tab; a new question reruns only this fragment."""
     st.markdown("#### Ask about your analyses")
 
     for message in st.session_state.memory_messages:
@@ -331,14 +609,12 @@ with tab2:
             st.markdown(memory_prompt)
 
         with st.chat_message("assistant"):
-            with st.spinner("🤔 Thinking…"):
-                try:
-                    memori_context = ""
-                    if st.session_state.memori_initialized:
+            try:
+                memori_context = ""
+                if st.session_state.memori_initialized:
+                    with st.spinner("🤔 Thinking…"):
                         try:
-                            memori_results = st.session_state.memori.search(
-                                memory_prompt, limit=5
-                            )
+                            memori_results = memori_search_cached(memory_prompt, 5)
                             if memori_results:
                                 memori_context = (
                                     "\n\nMemori context from prior analyses:\n"
@@ -347,380 +623,31 @@ with tab2:
                         except Exception:
                             pass
 
-                    analysis_context = ""
-                    if st.session_state.analysis_results:
-                        analysis_context = f"\n\nLatest Analysis Results for {st.session_state.user_company}:\n"
-                        for i, analysis in enumerate(
-                            st.session_state.analysis_results, 1
-                        ):
-                            analysis_context += f"{i}. {analysis.title} - {analysis.sentiment_analysis} - {analysis.summary}\n"
-
-                    followup_agent = Agent(
-                        name="Brand Memory Assistant",
-                        description=f"""You answer questions strictly about prior analyses.
-
-Company: {st.session_state.user_company or 'Not specified'}
-Keywords: {', '.join(st.session_state.search_queries) if st.session_state.search_queries else 'Not specified'}
-{analysis_context}
-{memori_context}
-
-If asked outside scope, politely say you only answer about stored analyses.""",
-                        model=st.session_state.nebius_model,
-                        markdown=True,
+                # Memori context changes per question, so it goes with the
+                # message rather than into the reusable agent's description.
+                # The answer is rendered as it is generated.
+                response_text = st.write_stream(
+                    stream_agent_response(
+                        get_followup_agent(), f"{memory_prompt}{memori_context}"
                     )
+                )
 
-                    response = followup_agent.run(memory_prompt)
-                    response_text = (
-                        str(response.content)
-                        if hasattr(response, "content")
-                        else str(response)
-                    )
+                if st.session_state.memori_initialized:
+                    memori_ingest(memory_prompt, response_text)
 
-                    if st.session_state.memori_initialized:
-                        try:
-                            from memorisdk import MemoriContext
-
-                            st.session_state.memori.ingest(
-                                MemoriContext(
-                                    user_input=memory_prompt,
-                                    assistant_output=response_text,
-                                )
-                            )
-                        except Exception:
-                            pass
-
-                    st.session_state.memory_messages.append(
-                        {"role": "assistant", "content": response_text}
-                    )
-                    st.markdown(response_text)
-                except Exception as e:
-                    err = f"❌ Error: {str(e)}"
-                    st.session_state.memory_messages.append(
-                        {"role": "assistant", "content": err}
-                    )
-                    st.error(err)
-
-# Stop here to prevent legacy chat system from running
-st.stop()
-
-# Display chat messages
-for message in st.session_state.messages:
-    with st.chat_message(message["role"]):
-        st.markdown(message["content"])
-
-# Welcome message
-if (
-    st.session_state.conversation_state == "welcome"
-    and len(st.session_state.messages) == 0
-):
-    welcome_msg = """
-👋 Welcome! I'm your Brand Reputation Monitor.
-
-I help you track and analyze your brand's reputation by monitoring news, sentiment, and public perception. I can:
-
-1. **Monitor News Coverage** - Track news articles about your brand
-2. **Analyze Sentiment** - Understand positive, negative, or neutral sentiment
-3. **Extract Insights** - Get actionable insights about your brand reputation
-
-All our conversations are tracked with Memori, so you can ask follow-up questions anytime!
-
-**Let's get started!** 
-
-What is the name of your company?
-"""
-    st.session_state.messages.append({"role": "assistant", "content": welcome_msg})
-    st.session_state.conversation_state = "asked_company"
-    with st.chat_message("assistant"):
-        st.markdown(welcome_msg)
-
-# Chat input
-if prompt := st.chat_input("Type your message here..."):
-    # Add user message to chat
-    st.session_state.messages.append({"role": "user", "content": prompt})
-    with st.chat_message("user"):
-        st.markdown(prompt)
-
-    # Process based on conversation state
-    if st.session_state.conversation_state == "asked_company":
-        # User provided company name
-        st.session_state.user_company = prompt
-
-        response = f"""
-Great! I understand you want to monitor reputation for: **{prompt}**
-
-Now, what keywords would you like me to search for? Please provide search terms separated by commas.
-
-**Examples:**
-- `{prompt} news, {prompt} reviews, {prompt} controversy, {prompt} announcement`
-- `{prompt} stock, {prompt} earnings, {prompt} product launch`
-- `{prompt} customer feedback, {prompt} complaints, {prompt} success`
-
-**Please enter your search keywords:**
-"""
-        st.session_state.messages.append({"role": "assistant", "content": response})
-        st.session_state.conversation_state = "asked_keywords"
-        with st.chat_message("assistant"):
-            st.markdown(response)
-
-    elif st.session_state.conversation_state == "asked_keywords":
-        # User provided search keywords
-        try:
-            # Parse keywords from user input
-            keywords = [
-                keyword.strip() for keyword in prompt.split(",") if keyword.strip()
-            ]
-            st.session_state.search_queries = keywords
-
-            # Create config object
-            config = Config(
-                search_queries=keywords, num_news=5  # Default to 5 news articles
-            )
+                st.session_state.memory_messages.append(
+                    {"role": "assistant", "content": response_text}
+                )
+            except Exception as e:
+                err = f"❌ Error: {str(e)}"
+                st.session_state.memory_messages.append(
+                    {"role": "assistant", "content": err}
+                )
+                st.error(err)
 
-            response = f"""
-Perfect! I'll monitor reputation for **{st.session_state.user_company}** using these keywords:
-{', '.join(keywords)}
 
-Let me start analyzing the news and sentiment...
-"""
-            st.session_state.messages.append({"role": "assistant", "content": response})
-            st.session_state.conversation_state = "analyzing"
-            with st.chat_message("assistant"):
-                st.markdown(response)
-
-            # Run the analysis
-            with st.chat_message("assistant"):
-                with st.spinner(
-                    "🔍 Analyzing brand reputation... This may take a few minutes..."
-                ):
-                    try:
-                        # Step 1: Get Google News page URLs
-                        st.write("📰 Retrieving Google News page URLs...")
-                        google_news_page_urls = get_google_news_page_urls(
-                            config.search_queries
-                        )
-                        st.write(
-                            f"✅ Found {len(google_news_page_urls)} Google News page(s)"
-                        )
-
-                        # Step 2: Scrape news pages
-                        st.write("🔍 Scraping news pages...")
-                        scraped_news_pages = scrape_news_pages(google_news_page_urls)
-                        st.write("✅ News pages scraped!")
-
-                        # Step 3: Extract best news URLs
-                        st.write("🎯 Extracting most relevant news...")
-                        news_urls = get_best_news_urls(
-                            scraped_news_pages, config.num_news
-                        )
-                        st.write(f"✅ Found {len(news_urls)} relevant articles")
-
-                        # Step 4: Scrape news articles
-                        st.write("📄 Scraping news articles...")
-                        news_list = scrape_news_articles(news_urls)
-                        st.write("✅ Articles scraped!")
-
-                        # Step 5: Analyze news
-                        st.write("🧠 Analyzing sentiment and insights...")
-                        news_analysis_list = process_news_list(news_list)
-                        st.write("✅ Analysis complete!")
-
-                        # Store results
-                        st.session_state.analysis_results = news_analysis_list
-
-                        # Format results for display
-                        results_html = f"""
-## 📊 Brand Reputation Report for {st.session_state.user_company}
-
-**Search Keywords:** {', '.join(keywords)}
-**Analysis Date:** {st.session_state.messages[-1]['content'][:50]}...
-
----
-
-"""
-                        for i, analysis in enumerate(news_analysis_list, 1):
-                            sentiment_emoji = {
-                                "positive": "😊",
-                                "negative": "😞",
-                                "neutral": "😐",
-                            }.get(analysis.sentiment_analysis.lower(), "😐")
-
-                            results_html += f"""
-### {i}. {analysis.title}
-**URL:** {analysis.url}
-**Summary:** {analysis.summary}
-**Sentiment:** {sentiment_emoji} {analysis.sentiment_analysis.title()}
-
-**Key Insights:**
-"""
-                            for insight in analysis.insights:
-                                results_html += f"- {insight}\n"
-                            results_html += "\n---\n\n"
-
-                        # Add results to chat
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": results_html}
-                        )
-                        st.markdown(results_html)
-
-                        # Add follow-up prompt
-                        follow_up = f"""
-💡 **What would you like to do next?**
-
-You can ask me questions like:
-- "What's the overall sentiment for {st.session_state.user_company}?"
-- "Can you explain the insights from the analysis?"
-- "What company are we analyzing?"
-- "What keywords did we search for?"
-- "Can you summarize the key findings?"
-- "What are the main concerns mentioned?"
-
-Or request a new analysis with different keywords!
-"""
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": follow_up}
-                        )
-                        st.markdown(follow_up)
-
-                        # Update state to chatting
-                        st.session_state.conversation_state = "chatting"
-
-                    except Exception as e:
-                        error_msg = f"❌ Error during analysis: {str(e)}"
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": error_msg}
-                        )
-                        st.error(error_msg)
-                        st.session_state.conversation_state = "chatting"
-
-        except Exception as e:
-            error_msg = f"❌ Error parsing keywords: {str(e)}"
-            st.session_state.messages.append(
-                {"role": "assistant", "content": error_msg}
-            )
-            st.error(error_msg)
-
-    elif st.session_state.conversation_state == "chatting":
-        # User is asking follow-up questions
-        with st.chat_message("assistant"):
-            with st.spinner("🤔 Thinking..."):
-                try:
-                    # Check if user wants new analysis
-                    prompt_lower = prompt.lower()
-                    is_new_analysis = any(
-                        keyword in prompt_lower
-                        for keyword in [
-                            "analyze",
-                            "analysis",
-                            "monitor",
-                            "search",
-                            "new keywords",
-                            "different keywords",
-                        ]
-                    )
-
-                    if is_new_analysis:
-                        # Reset to ask for new keywords
-                        response = f"""
-I understand you want to run a new analysis for **{st.session_state.user_company}**.
-
-What new keywords would you like me to search for? Please provide search terms separated by commas.
-
-**Examples:**
-- `{st.session_state.user_company} news, {st.session_state.user_company} reviews, {st.session_state.user_company} controversy`
-- `{st.session_state.user_company} stock, {st.session_state.user_company} earnings`
-- `{st.session_state.user_company} customer feedback, {st.session_state.user_company} complaints`
+with tab1:
+    analysis_tab()
 
-**Please enter your new search keywords:**
-"""
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": response}
-                        )
-                        st.session_state.conversation_state = "asked_keywords"
-                        st.markdown(response)
-                    else:
-                        # Use LangChain for follow-up questions with context from Memori
-                        # First, search Memori for relevant context
-                        memori_context = ""
-                        if st.session_state.memori_initialized:
-                            try:
-                                # Search Memori for relevant past conversations
-                                memori_results = st.session_state.memori.search(
-                                    prompt, limit=3
-                                )
-                                if memori_results:
-                                    memori_context = "\n\nRelevant context from previous conversations:\n"
-                                    for result in memori_results:
-                                        memori_context += f"- {result}\n"
-                            except Exception as e:
-                                pass  # Silently fail if Memori search doesn't work
-
-                        # Build context from recent messages and analysis results
-                        context_str = ""
-                        for msg in st.session_state.messages[-6:]:  # Last 6 messages
-                            role = msg["role"]
-                            content = msg["content"][:1000]  # Limit content length
-                            context_str += f"{role}: {content}\n\n"
-
-                        # Add analysis results to context
-                        analysis_context = ""
-                        if st.session_state.analysis_results:
-                            analysis_context = f"\n\nCurrent Analysis Results for {st.session_state.user_company}:\n"
-                            for i, analysis in enumerate(
-                                st.session_state.analysis_results, 1
-                            ):
-                                analysis_context += f"{i}. {analysis.title} - {analysis.sentiment_analysis} - {analysis.summary}\n"
-
-                        # Create agent for follow-up questions
-                        followup_agent = Agent(
-                            name="Brand Reputation Assistant",
-                            description=f"""You are a Brand Reputation Monitor assistant. You help users understand their brand reputation analysis results.
-
-You have access to:
-- Company name: {st.session_state.user_company}
-- Search keywords used: {', '.join(st.session_state.search_queries) if st.session_state.search_queries else 'Not specified'}
-- Analysis results: {analysis_context}
-
-Answer questions about the analysis, company, keywords, sentiment, insights, etc.
-Be helpful, concise, and reference specific data from the analysis when relevant.
-
-{memori_context}
-
-Recent conversation context:
-{context_str}""",
-                            model=st.session_state.nebius_model,
-                            markdown=True,
-                        )
-
-                        response = followup_agent.run(prompt)
-
-                        # FIX: Convert RunOutput to string
-                        response_text = (
-                            str(response.content)
-                            if hasattr(response, "content")
-                            else str(response)
-                        )
-
-                        # Record to Memori (manually, since auto-ingest doesn't work)
-                        if st.session_state.memori_initialized:
-                            try:
-                                from memorisdk import MemoriContext
-
-                                context = MemoriContext(
-                                    user_input=prompt, assistant_output=response_text
-                                )
-                                st.session_state.memori.ingest(context)
-                            except Exception as e:
-                                pass  # Silently fail to avoid UI clutter
-
-                        # Add to chat
-                        st.session_state.messages.append(
-                            {"role": "assistant", "content": response_text}
-                        )
-                        st.markdown(response_text)
-
-                except Exception as e:
-                    error_msg = f"❌ Error: {str(e)}"
-                    st.session_state.messages.append(
-                        {"role": "assistant", "content": error_msg}
-                    )
-                    st.error(error_msg)
+with tab2:
+    memory_tab()
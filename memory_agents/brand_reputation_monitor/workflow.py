@@ -4,9 +4,13 @@ from agno.models.nebius import Nebius
 from agno.agent import Agent
 from pydantic import BaseModel, Field
 from typing import List
+import hashlib
 import json
 import os
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -14,6 +18,10 @@ load_dotenv()
 # Initialize the Bright Data SDK client
 brightdata_client = bdclient(api_token=os.getenv("BRIGHTDATA_API_KEY"))
 
+# Upper bound on parallel Bright Data requests per scrape call; the SDK
+# fans a list of URLs out over a thread pool of this size
+MAX_SCRAPE_WORKERS = 20
+
 # Initialize Nebius AI model
 nebius_model = Nebius(
     id="Qwen/Qwen3-Coder-480B-A35B-Instruct",
@@ -21,6 +29,31 @@ nebius_model = Nebius(
 )
 
 
+# URLs starting with http:// or https:// in free-form LLM output
+_URL_RE = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+
+
+# Query parameters that only track the click and don't change the article
+_TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "cmpid"}
+
+
+def _canonicalize_url(url):
+    # Normalize scheme/host case and drop tracking params and fragments so the
+    # same article found through different queries is recognized as one
+    parts = urlsplit(url)
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+            and key.lower() not in _TRACKING_PARAMS
+        ]
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, query, "")
+    )
+
+
 # Pydantic models
 class Config(BaseModel):
     search_queries: List[str] = Field(..., min_length=1)
@@ -61,11 +94,17 @@ def get_google_news_page_urls(search_queries):
     return news_page_urls
 
 
+def _scrape_workers(urls):
+    # One worker per URL so a whole batch is scraped in a single wave
+    return max(1, min(len(urls), MAX_SCRAPE_WORKERS))
+
+
 def scrape_news_pages(news_page_urls):
     # Scrape each news page in parallel and return their content in Markdown
     return brightdata_client.scrape(
         url=news_page_urls,
         data_format="markdown",
+        max_workers=_scrape_workers(news_page_urls),
     )
 
 
@@ -93,8 +132,7 @@ def get_best_news_urls(news_pages, num_news):
     urls = []
 
     # Use regex to find all URLs that start with http:// or https://
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    found_urls = re.findall(url_pattern, response_text)
+    found_urls = _URL_RE.findall(response_text)
 
     for url in found_urls:
         # Clean up URL - remove trailing punctuation
@@ -131,7 +169,17 @@ def get_best_news_urls(news_pages, num_news):
                 ) and url not in urls:
                     urls.append(url)
 
-    return urls[:num_news]  # Return only the requested number
+    # Drop the same article listed under different URLs so each one is
+    # scraped and analyzed only once
+    seen = set()
+    unique_urls = []
+    for url in urls:
+        canonical = _canonicalize_url(url)
+        if canonical not in seen:
+            seen.add(canonical)
+            unique_urls.append(url)
+
+    return unique_urls[:num_news]  # Return only the requested number
 
 
 def scrape_news_articles(news_urls):
@@ -139,6 +187,7 @@ def scrape_news_articles(news_urls):
     news_content_list = brightdata_client.scrape(
         url=news_urls,
         data_format="markdown",
+        max_workers=_scrape_workers(news_urls),
     )
 
     news_list = []
@@ -153,12 +202,12 @@ def scrape_news_articles(news_urls):
     return news_list
 
 
-def process_news_list(news_list):
-    # Where to store the analyzed news articles
-    news_analysis_list = []
+# Upper bound on concurrent Nebius calls when analyzing articles
+MAX_ANALYSIS_WORKERS = 8
+
 
-    # Create agent for news analysis
-    analysis_agent = Agent(
+def _build_analysis_agent():
+    return Agent(
         name="News Analysis Agent",
         description="""Given news content, analyze it for brand reputation monitoring:
 1. Extract the title
@@ -182,22 +231,32 @@ INSIGHTS:
         markdown=True,
     )
 
-    # Analyze each news article with Nebius AI for brand reputation monitoring insights
-    for news in news_list:
-        response = analysis_agent.run(
-            f"NEWS URL: {news['url']}\n\nNEWS CONTENT: {news['content']}"
-        )
 
-        # Convert RunOutput to string - FIX for 'RunOutput' object has no attribute 'split'
-        response_text = (
-            str(response.content) if hasattr(response, "content") else str(response)
-        )
+def analyze_news(news):
+    # Analyze one news article with Nebius AI for brand reputation monitoring
+    # insights; each call gets its own agent so calls can run in parallel
+    response = _build_analysis_agent().run(
+        f"NEWS URL: {news['url']}\n\nNEWS CONTENT: {news['content']}"
+    )
+
+    # Convert RunOutput to string - FIX for 'RunOutput' object has no attribute 'split'
+    response_text = (
+        str(response.content) if hasattr(response, "content") else str(response)
+    )
 
-        # Parse the response into NewsAnalysis object
-        analysis = parse_news_analysis(response_text, news["url"])
-        news_analysis_list.append(analysis)
+    # Parse the response into NewsAnalysis object
+    return parse_news_analysis(response_text, news["url"])
 
-    return news_analysis_list
+
+def process_news_list(news_list):
+    # The LLM calls are network-bound, so analyze the articles concurrently;
+    # map() keeps the results in the same order as news_list
+    if not news_list:
+        return []
+    with ThreadPoolExecutor(
+        max_workers=min(len(news_list), MAX_ANALYSIS_WORKERS)
+    ) as executor:
+        return list(executor.map(analyze_news, news_list))
 
 
 def parse_news_analysis(response_text, original_url):
@@ -239,6 +298,49 @@ def parse_news_analysis(response_text, original_url):
     )
 
 
+# On-disk cache of finished analyses, keyed by company + keywords + article count
+ANALYSIS_CACHE_DIR = os.getenv("ANALYSIS_CACHE_DIR", ".analysis_cache")
+ANALYSIS_CACHE_TTL_SECONDS = 24 * 3600
+
+
+def _analysis_cache_path(company, search_queries, num_news):
+    request = json.dumps(
+        {
+            "company": company.strip().lower(),
+            "keywords": sorted(search_queries),
+            "num_news": num_news,
+        }
+    )
+    key = hashlib.blake2b(request.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(ANALYSIS_CACHE_DIR, f"{key}.json")
+
+
+def load_cached_analysis(company, search_queries, num_news):
+    """Return the analysis of an identical request from the last 24h, or None."""
+    path = _analysis_cache_path(company, search_queries, num_news)
+    try:
+        if time.time() - os.path.getmtime(path) > ANALYSIS_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return [NewsAnalysis.model_validate(item) for item in json.load(f)]
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_analysis(company, search_queries, num_news, news_analysis_list):
+    """Store an analysis so identical requests can skip the pipeline."""
+    # An empty result usually means the search or analysis failed; don't pin it
+    if not news_analysis_list:
+        return
+    path = _analysis_cache_path(company, search_queries, num_news)
+    try:
+        os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump([analysis.model_dump() for analysis in news_analysis_list], f)
+    except OSError as e:
+        print(f"Warning: could not cache analysis: {e}")
+
+
 def main():
     # Read the config file and validate it
     with open("config.json", "r", encoding="utf-8") as f:
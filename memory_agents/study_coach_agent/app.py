@@ -262,8 +262,20 @@ def study_plan_tab(memori_mgr: MemoriManager):
         )
 
 
+def _report_session_log_failure() -> None:
+    """Surface an error from the last background study-session write, once."""
+    future = st.session_state.get("session_log_future")
+    if future is None or not future.done():
+        return
+    st.session_state.session_log_future = None
+    error = future.exception()
+    if error is not None:
+        st.error(f"Failed to log the last study session: {error}")
+
+
 def today_session_tab(memori_mgr: MemoriManager):
     st.markdown("#### 📅 Today’s Study Session")
+    _report_session_log_failure()
 
     profile: LearnerProfile | None = st.session_state.learner_profile
     if not profile:
@@ -373,7 +385,8 @@ def today_session_tab(memori_mgr: MemoriManager):
                     f"- Feedback: {result.feedback or ''}\n"
                     f"- Next step: {result.next_step_recommendation or ''}"
                 )
-                mgr.log_study_session(summary)
+                # Written in the background; failures are shown on a later rerun
+                st.session_state.session_log_future = mgr.log_study_session(summary)
 
             except Exception as e:
                 st.error(f"Failed to evaluate and log session: {e}")
@@ -1,16 +1,90 @@
+import atexit
 import json
+import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 from dotenv import load_dotenv
 from memori import Memori
 from openai import OpenAI
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the json module works the same way
+    orjson = None
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Runs memory writes the UI doesn't need to wait for
+_BACKGROUND_POOL = ThreadPoolExecutor(max_workers=4)
+atexit.register(_BACKGROUND_POOL.shutdown, wait=False)
+
+
+def _log_background_failure(future: Future) -> None:
+    error = future.exception()
+    if error is not None:
+        logger.error("Background Memori write failed", exc_info=error)
+
+
+# Prefix marking learner profile documents stored in Memori
+PROFILE_TAG = "STUDY_COACH_PROFILE"
+_JSON_DECODER = json.JSONDecoder()
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Cached progress answers, reused for repeated questions (same normalized
+# text) and, when ENABLE_SEMANTIC_CACHE=1, for questions whose embeddings are
+# at least this cosine-similar to an earlier one
+PROGRESS_CACHE_SIZE = 256
+PROGRESS_CACHE_SIMILARITY = 0.92
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize `obj` to a UTF-8 JSON string, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+@lru_cache(maxsize=4)
+def _get_engine(db_url: str) -> Engine:
+    """
+    Return the process-wide engine for `db_url`, so every MemoriManager shares
+    one connection pool instead of opening a new one.
+    """
+    engine = create_engine(
+        db_url,
+        pool_pre_ping=True,
+        pool_size=10,
+        max_overflow=5,
+        pool_recycle=1800,
+    )
+
+    # Optional connectivity check, opt in with MEMORI_DB_PROBE=1. AUTOCOMMIT
+    # keeps it from leaving an open transaction behind a pooler like PgBouncer.
+    if os.getenv("MEMORI_DB_PROBE", "0") == "1":
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(text("SELECT 1"))
+
+    return engine
+
+
+@lru_cache(maxsize=10_000)
+def _embed_cached(client: OpenAI, model: str, text: str) -> tuple[float, ...]:
+    """Embed `text`, reusing earlier results for identical (model, text) pairs."""
+    response = client.embeddings.create(model=model, input=text)
+    return tuple(response.data[0].embedding)
+
 
 class MemoriManager:
     """
@@ -46,17 +120,11 @@ class MemoriManager:
             )
 
         # Single Cockroach/Postgres-compatible SQLAlchemy engine
-        engine = create_engine(
-            db_url_effective,
-            pool_pre_ping=True,
-        )
-
-        # Optional connectivity check
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        engine = _get_engine(db_url_effective)
 
+        # Skip expiring loaded state on every commit Memori makes
         self.SessionLocal: sessionmaker | None = sessionmaker(
-            autocommit=False, autoflush=False, bind=engine
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
         )
         conn_arg: Any = self.SessionLocal
 
@@ -68,6 +136,12 @@ class MemoriManager:
         self.memori: Memori = mem
         self.openai_client = client
 
+        self.semantic_cache_enabled = os.getenv("ENABLE_SEMANTIC_CACHE", "0") == "1"
+        self._progress_cache: OrderedDict[str, tuple[np.ndarray | None, str]] = (
+            OrderedDict()
+        )
+        self._progress_cache_lock = threading.Lock()
+
     def get_db(self) -> Session | None:
         if self.SessionLocal is None:
             return None
@@ -86,7 +160,8 @@ class MemoriManager:
             "version": 1,
             "profile": profile_data,
         }
-        tagged_text = "STUDY_COACH_PROFILE " + json.dumps(payload, ensure_ascii=False)
+        tagged_text = f"{PROFILE_TAG} " + _dumps_json(payload)
+        self.clear_progress_cache()
 
         self.openai_client.chat.completions.create(
             model="gpt-4o-mini",
@@ -111,10 +186,19 @@ class MemoriManager:
             # Non-fatal; Memori should still persist in most configurations.
             pass
 
-    def log_study_session(self, session_summary: str) -> None:
+    def log_study_session(self, session_summary: str) -> Future[None]:
         """
         Store a single study session summary (topic, duration, score, mood, etc.).
+
+        The write runs on a background thread so the UI doesn't wait on the
+        LLM round-trip; the returned Future holds any error it raised.
         """
+        self.clear_progress_cache()
+        future = _BACKGROUND_POOL.submit(self._log_study_session_sync, session_summary)
+        future.add_done_callback(_log_background_failure)
+        return future
+
+    def _log_study_session_sync(self, session_summary: str) -> None:
         prompt = (
             "The following text summarizes one study session for this learner. "
             "Extract and remember: topic, difficulty, performance, misconceptions, "
@@ -140,6 +224,9 @@ class MemoriManager:
         except Exception:
             pass
 
+        # Drop answers cached while the session was still being stored
+        self.clear_progress_cache()
+
     def summarize_progress(self, question: str) -> str:
         """
         Ask Memori/LLM to summarize progress, weak/strong topics, or patterns.
@@ -151,6 +238,13 @@ class MemoriManager:
             "question using those memories. Be concrete about weak/strong topics "
             "and any patterns across time (time of day, resource type, etc.)."
         )
+        embedding = None
+        if self.semantic_cache_enabled:
+            embedding = self._embed(question)
+        cached = self._lookup_progress_answer(question, embedding)
+        if cached is not None:
+            return cached
+
         response = self.openai_client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
@@ -158,7 +252,60 @@ class MemoriManager:
                 {"role": "user", "content": question},
             ],
         )
-        return response.choices[0].message.content
+        answer = response.choices[0].message.content
+        if answer:
+            self._cache_progress_answer(question, embedding, answer)
+        return answer
+
+    # --- Progress answer cache ---
+
+    def clear_progress_cache(self) -> None:
+        """Forget cached progress answers, e.g. after new memories are stored."""
+        with self._progress_cache_lock:
+            self._progress_cache.clear()
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Return the unit-normalized embedding of `text`."""
+        vector = np.asarray(
+            _embed_cached(self.openai_client, EMBEDDING_MODEL, text),
+            dtype=np.float32,
+        )
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _lookup_progress_answer(
+        self, question: str, embedding: np.ndarray | None
+    ) -> str | None:
+        key = " ".join(question.lower().split())
+        with self._progress_cache_lock:
+            if not self._progress_cache:
+                return None
+            if key in self._progress_cache:
+                self._progress_cache.move_to_end(key)
+                return self._progress_cache[key][1]
+            if embedding is None:
+                return None
+
+            keys = [k for k, (v, _) in self._progress_cache.items() if v is not None]
+            if not keys:
+                return None
+            matrix = np.stack([self._progress_cache[k][0] for k in keys])
+            # Stored vectors are unit-normalized, so this is cosine similarity
+            scores = matrix @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < PROGRESS_CACHE_SIMILARITY:
+                return None
+            self._progress_cache.move_to_end(keys[best])
+            return self._progress_cache[keys[best]][1]
+
+    def _cache_progress_answer(
+        self, question: str, embedding: np.ndarray | None, answer: str
+    ) -> None:
+        key = " ".join(question.lower().split())
+        with self._progress_cache_lock:
+            self._progress_cache[key] = (embedding, answer)
+            self._progress_cache.move_to_end(key)
+            while len(self._progress_cache) > PROGRESS_CACHE_SIZE:
+                self._progress_cache.popitem(last=False)
 
     def get_latest_learner_profile(self) -> dict[str, Any] | None:
         """
@@ -176,26 +323,27 @@ class MemoriManager:
         try:
             # Search for our tag; Memori returns stored documents/snippets, not
             # hallucinated content.
-            results: list[Any] = search_fn("STUDY_COACH_PROFILE", limit=5) or []
+            results: list[Any] = search_fn(PROFILE_TAG, limit=5) or []
         except Exception:
             return None
 
-        tag = "STUDY_COACH_PROFILE"
         for r in results:
             text = str(r)
 
             # We always store profiles as: "STUDY_COACH_PROFILE { ...json... }"
-            tag_idx = text.find(tag)
+            tag_idx = text.find(PROFILE_TAG)
             if tag_idx == -1:
                 continue
 
-            json_str = text[tag_idx + len(tag) :].strip()
-            if not json_str:
+            # Decode just the JSON object after the tag, ignoring anything the
+            # search result appends after it
+            json_start = text.find("{", tag_idx + len(PROFILE_TAG))
+            if json_start == -1:
                 continue
 
             try:
-                obj = json.loads(json_str)
-            except Exception:
+                obj, _ = _JSON_DECODER.raw_decode(text, json_start)
+            except ValueError:
                 continue
 
             if not isinstance(obj, dict):
@@ -12,6 +12,9 @@ It is imported by `app.py`, which focuses on the Streamlit UI.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 
 import streamlit as st
 import yt_dlp
@@ -19,23 +22,48 @@ from dotenv import load_dotenv
 from exa_py import Exa
 from memori import Memori
 from openai import OpenAI
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 load_dotenv()
 
+# Videos sent to the LLM per ingestion call; one call per video is ~20x slower
+INGEST_BATCH_SIZE = int(os.getenv("YOUTUBE_TREND_INGEST_BATCH_SIZE", "5"))
+# Ingestion batches sent concurrently
+INGEST_WORKERS = int(os.getenv("YOUTUBE_TREND_INGEST_WORKERS", "8"))
+
 
 class _SilentLogger:
     """Minimal logger for yt-dlp that suppresses debug/warning output."""
 
-    def debug(self, msg):
-        pass
+    debug = warning = error = staticmethod(lambda *args, **kwargs: None)
 
-    def warning(self, msg):
-        pass
 
-    def error(self, msg):
-        pass
+@lru_cache(maxsize=4)
+def _get_engine(database_url: str) -> Engine:
+    """
+    Return the process-wide engine for `database_url`, so Streamlit reruns
+    reuse one connection pool instead of building a new one each time.
+    """
+    # Pre-ping only guards against dropped network connections; for a local
+    # SQLite file it would just add a SELECT 1 to every checkout.
+    is_network_db = database_url.startswith(("postgresql", "cockroachdb", "mysql"))
+    engine = create_engine(
+        database_url,
+        pool_pre_ping=is_network_db,
+        pool_recycle=1800 if is_network_db else -1,
+        connect_args={} if is_network_db else {"check_same_thread": False},
+    )
+
+    # Optional connectivity check, opt in with MEMORI_DB_PROBE=1. AUTOCOMMIT
+    # keeps it from leaving an open transaction behind a pooler like PgBouncer.
+    if os.getenv("MEMORI_DB_PROBE", "0") == "1":
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            conn.execute(text("SELECT 1"))
+
+    return engine
 
 
 def init_memori_with_nebius() -> Memori | None:
@@ -63,18 +91,12 @@ def init_memori_with_nebius() -> Memori | None:
     try:
         db_path = os.getenv("SQLITE_DB_PATH", "./memori.sqlite")
         database_url = f"sqlite:///{db_path}"
-        engine = create_engine(
-            database_url,
-            pool_pre_ping=True,
-            connect_args={"check_same_thread": False},
+        engine = _get_engine(database_url)
+        # Skip expiring loaded state on every commit Memori makes while ingesting
+        SessionLocal = sessionmaker(
+            autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
         )
 
-        # Optional DB connectivity check
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
-
-        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
         client = OpenAI(
             base_url=base_url,
             api_key=api_key,
@@ -93,22 +115,29 @@ def init_memori_with_nebius() -> Memori | None:
         return None
 
 
-def fetch_channel_videos(channel_url: str) -> list[dict]:
+@st.cache_data(ttl=1800, show_spinner=False)
+def fetch_channel_videos(channel_url: str) -> tuple[list[dict], str]:
     """
     Use yt-dlp to fetch recent YouTube videos for a given channel or playlist URL.
 
+    Results are cached per URL for 30 minutes, so reruns and repeat ingestions
+    don't scrape YouTube again. yt-dlp errors are raised (and not cached).
+
     Returns:
-        A list of dicts:
-        [
-          {
-            "title": "...",
-            "url": "...",
-            "published_at": "...",
-            "views": "...",
-            "topics": ["...", ...]
-          },
-          ...
-        ]
+        A tuple of the video dicts and the channel title:
+        (
+          [
+            {
+              "title": "...",
+              "url": "...",
+              "published_at": "...",
+              "views": "...",
+              "topics": ["...", ...]
+            },
+            ...
+          ],
+          "Channel title",
+        )
     """
     ydl_opts = {
         # Don't download video files, we only want metadata
@@ -123,17 +152,14 @@ def fetch_channel_videos(channel_url: str) -> list[dict]:
         "logger": _SilentLogger(),
     }
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(channel_url, download=False)
-    except Exception as e:
-        st.error(f"Error fetching YouTube channel info: {e}")
-        return []
+    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+        info = ydl.extract_info(channel_url, download=False)
+
+    if not isinstance(info, dict):
+        return [], ""
 
     entries = info.get("entries") or []
-    # Cache channel title for use in prompts
-    if isinstance(info, dict):
-        st.session_state["channel_title"] = info.get("title") or ""
+    channel_title = info.get("title") or ""
 
     videos: list[dict] = []
 
@@ -171,7 +197,45 @@ def fetch_channel_videos(channel_url: str) -> list[dict]:
             }
         )
 
-    return videos
+    return videos, channel_title
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _search_exa_trends(base_niche: str, api_key: str) -> str:
+    """
+    Search Exa for trends in `base_niche` and format them as bullet points.
+
+    Cached per niche so repeat ingestions of the same channel skip the
+    network call; errors propagate and are not cached.
+    """
+    query = (
+        f"Current trending topics and YouTube-style video ideas for the niche: {base_niche}. "
+        f"Focus on developer, programming, AI, and technology content if relevant."
+    )
+
+    client = Exa(api_key=api_key)
+    # Keep the API call simple to avoid deprecated options like 'highlights'
+    res = client.search_and_contents(
+        query=query,
+        num_results=5,
+        type="auto",
+    )
+
+    results = getattr(res, "results", []) or []
+    if not results:
+        return ""
+
+    trend_lines: list[str] = []
+    for doc in results[:5]:
+        title = getattr(doc, "title", "") or "Untitled"
+        url = getattr(doc, "url", "") or ""
+        text = getattr(doc, "text", "") or ""
+        # Normalize whitespace on a bounded prefix rather than the whole page
+        snippet = " ".join(text[:1024].split())[:220]
+        line = f"- {title} ({url}) — {snippet}"
+        trend_lines.append(line)
+
+    return "\n".join(trend_lines)
 
 
 def fetch_exa_trends(channel_name: str, videos: list[dict]) -> str:
@@ -185,14 +249,15 @@ def fetch_exa_trends(channel_name: str, videos: list[dict]) -> str:
     if not api_key:
         return ""
 
-    # Build a niche description from tags and titles
-    tags: set[str] = set()
-    for v in videos:
-        for t in v.get("topics") or []:
-            if isinstance(t, str):
-                tags.add(t)
+    # Build a niche description from tags and titles. Deduplicate in first-seen
+    # order so the same channel always yields the same query (and cache key).
+    tags = dict.fromkeys(
+        t
+        for t in chain.from_iterable(v.get("topics") or () for v in videos)
+        if isinstance(t, str)
+    )
 
-    base_niche = ", ".join(list(tags)[:10])
+    base_niche = ", ".join(islice(tags, 10))
     if not base_niche:
         titles = [v.get("title") or "" for v in videos[:5]]
         base_niche = ", ".join(titles)
@@ -200,37 +265,107 @@ def fetch_exa_trends(channel_name: str, videos: list[dict]) -> str:
     if not base_niche:
         return ""
 
-    query = (
-        f"Current trending topics and YouTube-style video ideas for the niche: {base_niche}. "
-        f"Focus on developer, programming, AI, and technology content if relevant."
-    )
-
     try:
-        client = Exa(api_key=api_key)
-        # Keep the API call simple to avoid deprecated options like 'highlights'
-        res = client.search_and_contents(
-            query=query,
-            num_results=5,
-            type="auto",
-        )
+        return _search_exa_trends(base_niche, api_key)
     except Exception as e:
         st.warning(f"Exa web search issue: {e}")
         return ""
 
-    results = getattr(res, "results", []) or []
-    if not results:
-        return ""
 
-    trend_lines: list[str] = []
-    for doc in results[:5]:
-        title = getattr(doc, "title", "") or "Untitled"
-        url = getattr(doc, "url", "") or ""
-        text = getattr(doc, "text", "") or ""
-        snippet = " ".join(text.split())[:220]
-        line = f"- {title} ({url}) — {snippet}"
-        trend_lines.append(line)
+# (field, default) pairs for the video fields rendered into Memori documents
+_VIDEO_DOC_DEFAULTS = (
+    ("title", "Untitled video"),
+    ("published_at", "Unknown"),
+    ("views", "Unknown"),
+    ("topics", ()),
+    ("description", ""),
+    ("duration_seconds", "Unknown"),
+)
 
-    return "\n".join(trend_lines)
+
+def _format_video_doc(video: dict, channel_url: str) -> str:
+    """Render one scraped video as a plain-text document for Memori."""
+    title, published_at, views, topics, description, duration = (
+        video.get(key) or default for key, default in _VIDEO_DOC_DEFAULTS
+    )
+    url = video.get("url") or channel_url
+
+    topics_str = ", ".join(map(str, topics)) or "N/A"
+    # Truncate very long descriptions for ingestion
+    desc_snippet = description[:1000]
+
+    return f"""YouTube Video
+Channel URL: {channel_url}
+Title: {title}
+Video URL: {url}
+Published at: {published_at}
+Views: {views}
+Duration (seconds): {duration}
+Topics: {topics_str}
+Description:
+{desc_snippet}
+"""
+
+
+def _store_documents(client: OpenAI, doc_texts: list[str]) -> None:
+    """
+    Send video documents through the registered client in a single completion
+    so that Memori v3 can automatically capture them as "memories".
+    """
+    if len(doc_texts) == 1:
+        payload = doc_texts[0]
+    else:
+        payload = "\n\n---\n\n".join(
+            f"[Video {n}/{len(doc_texts)}]\n{doc_text}"
+            for n, doc_text in enumerate(doc_texts, start=1)
+        )
+
+    client.chat.completions.create(
+        model=os.getenv(
+            "YOUTUBE_TREND_INGEST_MODEL",
+            "MiniMax-M2.1",
+        ),
+        messages=[
+            {
+                "role": "user",
+                "content": (
+                    "Store the following YouTube video metadata in memory "
+                    "for future channel-trend analysis. Respond with a short "
+                    "acknowledgement only.\n\n"
+                    f"{payload}"
+                ),
+            }
+        ],
+    )
+
+
+def _ingest_batch(
+    client: OpenAI, batch: list[tuple[dict, str]]
+) -> tuple[int, list[str]]:
+    """
+    Ingest one batch of (video, doc_text) pairs.
+
+    Returns:
+        The number of videos ingested and a warning message per failed video.
+    """
+    try:
+        _store_documents(client, [doc_text for _, doc_text in batch])
+        return len(batch), []
+    except Exception:
+        # Fall back to one call per video so a single bad item doesn't
+        # drop the whole batch
+        pass
+
+    ingested = 0
+    errors: list[str] = []
+    for video, doc_text in batch:
+        try:
+            _store_documents(client, [doc_text])
+            ingested += 1
+        except Exception as e:
+            title = video.get("title") or "Untitled video"
+            errors.append(f"Memori/Nebius issue ingesting video '{title}': {e}")
+    return ingested, errors
 
 
 def ingest_channel_into_memori(channel_url: str) -> int:
@@ -251,7 +386,15 @@ def ingest_channel_into_memori(channel_url: str) -> int:
         st.error("Memori/Nebius failed to initialize; cannot ingest channel.")
         return 0
 
-    videos = fetch_channel_videos(channel_url)
+    try:
+        videos, channel_title = fetch_channel_videos(channel_url)
+    except Exception as e:
+        st.error(f"Error fetching YouTube channel info: {e}")
+        return 0
+
+    # Cache channel title for use in prompts
+    st.session_state["channel_title"] = channel_title
+
     if not videos:
         st.warning("No videos were parsed from the YouTube channel response.")
         raw = st.session_state.get("yt_raw_response")
@@ -272,55 +415,21 @@ def ingest_channel_into_memori(channel_url: str) -> int:
     # Cache videos in session state so the chat agent can use them directly
     st.session_state["channel_videos"] = videos
 
-    ingested = 0
-    for video in videos:
-        title = video.get("title") or "Untitled video"
-        url = video.get("url") or channel_url
-        published_at = video.get("published_at") or "Unknown"
-        views = video.get("views") or "Unknown"
-        topics = video.get("topics") or []
-        description = video.get("description") or ""
-        duration = video.get("duration_seconds") or "Unknown"
-
-        topics_str = ", ".join(str(t) for t in topics) if topics else "N/A"
-        # Truncate very long descriptions for ingestion
-        desc_snippet = description[:1000]
-
-        doc_text = f"""YouTube Video
-Channel URL: {channel_url}
-Title: {title}
-Video URL: {url}
-Published at: {published_at}
-Views: {views}
-Duration (seconds): {duration}
-Topics: {topics_str}
-Description:
-{desc_snippet}
-"""
+    docs = [(video, _format_video_doc(video, channel_url)) for video in videos]
 
-        try:
-            # Send this document through the registered Nebius client so that
-            # Memori v3 can automatically capture it as a "memory".
-            _ = client.chat.completions.create(
-                model=os.getenv(
-                    "YOUTUBE_TREND_INGEST_MODEL",
-                    "MiniMax-M2.1",
-                ),
-                messages=[
-                    {
-                        "role": "user",
-                        "content": (
-                            "Store the following YouTube video metadata in memory "
-                            "for future channel-trend analysis. Respond with a short "
-                            "acknowledgement only.\n\n"
-                            f"{doc_text}"
-                        ),
-                    }
-                ],
-            )
-            ingested += 1
-        except Exception as e:
-            st.warning(f"Memori/Nebius issue ingesting video '{title}': {e}")
+    batches = [
+        docs[i : i + INGEST_BATCH_SIZE] for i in range(0, len(docs), INGEST_BATCH_SIZE)
+    ]
+    # Completions are network-bound, so send the batches concurrently; the
+    # worker threads only collect errors and warnings are emitted from here
+    with ThreadPoolExecutor(max_workers=INGEST_WORKERS) as executor:
+        results = list(executor.map(lambda b: _ingest_batch(client, b), batches))
+
+    ingested = 0
+    for count, errors in results:
+        ingested += count
+        for error in errors:
+            st.warning(error)
 
     # Flush writes if needed
     try:
@@ -1,11 +1,32 @@
+import asyncio
+import io
 import os
-from openai import OpenAI
+import threading
+from openai import APITimeoutError, AsyncOpenAI, OpenAI, RateLimitError
 import streamlit as st
 from dotenv import load_dotenv
 import tempfile
 import shutil
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import fitz  # PyMuPDF for PDF to image
+from PIL import Image
+from aiolimiter import AsyncLimiter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+try:
+    # SIMD-accelerated encoder; same output as the standard library
+    from pybase64 import b64encode_as_string
+except ImportError:
+
+    def b64encode_as_string(data) -> str:
+        return base64.b64encode(data).decode()
+
 
 load_dotenv()
 
@@ -22,7 +43,7 @@ if "current_pdf" not in st.session_state:
 
     # Convert images to base64
 with open("./assets/nvidia-color.png", "rb") as nvidia_file:
-    nvidia_base64 = base64.b64encode(nvidia_file.read()).decode()
+    nvidia_base64 = b64encode_as_string(nvidia_file.read())
 
     # Create title with embedded images
 title_html = f"""
@@ -35,6 +56,8 @@ title_html = f"""
         """
 st.markdown(title_html, unsafe_allow_html=True)
 st.subheader("**Extract text from PDFs and images using NVIDIA Nemotron-Nano**")
+# Shows PDF pages in the main area as they finish OCR
+ocr_output = st.empty()
 
 # Sidebar for configuration
 with st.sidebar:
@@ -48,6 +71,22 @@ with st.sidebar:
         help="Your Nebius API key",
     )
 
+    # PDF pages are sent to the OCR model concurrently
+    ocr_concurrency = st.number_input(
+        "Max concurrent pages",
+        min_value=1,
+        max_value=32,
+        value=int(os.getenv("OCR_CONCURRENCY", "8")),
+        help="How many PDF pages are sent to the OCR model at the same time",
+    )
+    ocr_rps = st.number_input(
+        "Max requests per second",
+        min_value=1,
+        max_value=50,
+        value=int(os.getenv("OCR_RPS", "4")),
+        help="Upper bound on OCR requests per second, to stay under API rate limits",
+    )
+
     st.divider()
 
     # PDF or Image file upload
@@ -65,7 +104,7 @@ with st.sidebar:
         if file_type == "application/pdf":
             # Display PDF preview
             st.sidebar.subheader("PDF Preview")
-            base64_pdf = base64.b64encode(file.getvalue()).decode("utf-8")
+            base64_pdf = b64encode_as_string(file.getvalue())
             pdf_display = f'<iframe src="data:application/pdf;base64,{base64_pdf}" width="100%" height="500" type="application/pdf"></iframe>'
             st.sidebar.markdown(pdf_display, unsafe_allow_html=True)
         elif file_type in ["image/png", "image/jpeg", "image/jpg"]:
@@ -77,12 +116,159 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("Made with ❤️ by [Studio1](https://www.Studio1hq.com) Team")
 
-    def ocr(file, api_key):
+    _backoff_wait = wait_exponential_jitter(initial=1, max=30)
+
+    def _rate_limit_wait(retry_state):
+        """Wait as long as the server's Retry-After asks, else back off exponentially."""
+        error = retry_state.outcome.exception()
+        response = getattr(error, "response", None)
+        retry_after = (
+            response.headers.get("retry-after") if response is not None else None
+        )
+        try:
+            return min(float(retry_after), 30)
+        except (TypeError, ValueError):
+            return _backoff_wait(retry_state)
+
+    # Retry transient rate limits and timeouts so one 429 doesn't fail a page;
+    # the clients are built with max_retries=0 so this is the only retry layer
+    retry_on_rate_limit = retry(
+        retry=retry_if_exception_type((RateLimitError, APITimeoutError)),
+        wait=_rate_limit_wait,
+        stop=stop_after_attempt(3),
+        reraise=True,
+    )
+
+    @retry_on_rate_limit
+    def create_completion(client, **kwargs):
+        return client.chat.completions.create(**kwargs)
+
+    @retry_on_rate_limit
+    async def acreate_completion(client, limiter, **kwargs):
+        # Take a token per attempt so retries are rate-limited too, and the
+        # backoff between attempts doesn't hold the limiter
+        async with limiter:
+            return await client.chat.completions.create(**kwargs)
+
+    # Page render resolution; raise it for small print or dense scans
+    OCR_DPI = int(os.getenv("OCR_DPI", "150"))
+
+    # Per-thread JPEG output buffer, reused for every page that thread renders
+    _render_buffers = threading.local()
+
+    def render_page(doc, i):
+        """Rasterize one PDF page to JPEG and return it base64-encoded."""
+        page = doc.load_page(i)
+        pix = page.get_pixmap(dpi=OCR_DPI)
+        # Wrap the pixmap's samples without copying them, then JPEG-encode
+        # into the reused buffer; lossy JPEG is fine for OCR and far smaller
+        # to upload than PNG
+        image = Image.frombuffer(
+            "RGB", (pix.width, pix.height), pix.samples_mv, "raw", "RGB", pix.stride, 1
+        )
+        buffer = getattr(_render_buffers, "jpeg", None)
+        if buffer is None:
+            buffer = _render_buffers.jpeg = io.BytesIO()
+        buffer.seek(0)
+        buffer.truncate()
+        image.save(buffer, format="JPEG", quality=85)
+        with buffer.getbuffer() as jpeg_view:
+            return b64encode_as_string(jpeg_view)
+
+    async def ocr_pdf_pages(doc, ocr_prompt, api_key, concurrency, requests_per_second):
+        """OCR PDF pages concurrently, yielding (page_index, text) as each finishes."""
+        num_pages = doc.page_count
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+        # Spread requests out to stay under the provider's rate limit instead
+        # of bursting into 429s and backing off
+        limiter = AsyncLimiter(requests_per_second, 1)
+
+        async def ocr_page(client, render_executor, i):
+            mime = "image/jpeg"
+            async with semaphore:
+                # Render off the event loop so it overlaps other pages' requests
+                b64_data = await loop.run_in_executor(
+                    render_executor, render_page, doc, i
+                )
+                try:
+                    response = await acreate_completion(
+                        client,
+                        limiter,
+                        model="nvidia/Nemotron-Nano-V2-12b",
+                        # max_tokens=512,
+                        temperature=0.5,
+                        top_p=0.9,
+                        extra_body={"top_k": 50},
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": f"{ocr_prompt}\n\nNote: This is page {i+1} of {num_pages}. Extract content from this page only.",
+                                    },
+                                    {
+                                        "type": "image_url",
+                                        "image_url": {
+                                            "url": f"data:{mime};base64,{b64_data}"
+                                        },
+                                    },
+                                ],
+                            }
+                        ],
+                    )
+                    text = (
+                        response.choices[0].message.content
+                        if hasattr(response.choices[0].message, "content")
+                        else str(response)
+                    )
+                except Exception as e:
+                    text = f"OCR API call failed on page {i+1}: {e}"
+            return i, text
+
+        async with AsyncOpenAI(
+            base_url="https://api.tokenfactory.nebius.com/v1",
+            api_key=api_key or os.environ.get("NEBIUS_API_KEY"),
+            max_retries=0,
+        ) as client:
+            # PyMuPDF documents aren't thread-safe, so pages render one at a
+            # time on a single worker while earlier pages are being OCR'd
+            with ThreadPoolExecutor(max_workers=1) as render_executor:
+                for page_result in asyncio.as_completed(
+                    [ocr_page(client, render_executor, i) for i in range(num_pages)]
+                ):
+                    yield await page_result
+
+    async def stream_pdf_ocr(
+        doc, ocr_prompt, api_key, progress, concurrency, requests_per_second
+    ):
+        """Render each page's text as soon as it is ready; return texts in page order."""
+        num_pages = doc.page_count
+        results = [""] * num_pages
+        with ocr_output.container():
+            placeholders = [st.empty() for _ in range(num_pages)]
+
+        completed = 0
+        async for i, text in ocr_pdf_pages(
+            doc, ocr_prompt, api_key, concurrency, requests_per_second
+        ):
+            results[i] = text
+            placeholders[i].markdown(text)
+            completed += 1
+            progress.progress(
+                completed / num_pages,
+                text=f"Processed {completed} of {num_pages} pages...",
+            )
+        return results
+
+    def ocr(file, api_key, concurrency, requests_per_second):
         file_type = file.type
         file_bytes = file.getvalue()
         client = OpenAI(
             base_url="https://api.tokenfactory.nebius.com/v1",
             api_key=api_key or os.environ.get("NEBIUS_API_KEY"),
+            max_retries=0,
         )
 
         # Improved system prompt for better OCR results
@@ -145,11 +331,12 @@ Description of content here...
 This style is MUCH more readable than heading for every field."""
 
         if file_type in ["image/png", "image/jpeg", "image/jpg"]:
-            b64_data = base64.b64encode(file_bytes).decode()
+            b64_data = b64encode_as_string(file_bytes)
             mime = file_type
             with st.spinner("Extracting text from image..."):
                 try:
-                    response = client.chat.completions.create(
+                    response = create_completion(
+                        client,
                         model="nvidia/Nemotron-Nano-V2-12b",
                         max_tokens=512,
                         temperature=0.5,
@@ -189,53 +376,20 @@ This style is MUCH more readable than heading for every field."""
                     tmp_pdf.write(file_bytes)
                     tmp_pdf.flush()
                     doc = fitz.open(tmp_pdf.name)
-                    num_pages = doc.page_count
-                    results = []
                     progress = st.progress(0, text="Processing PDF pages...")
-                    for i in range(num_pages):
-                        page = doc.load_page(i)
-                        pix = page.get_pixmap()
-                        img_bytes = pix.tobytes("png")
-                        b64_data = base64.b64encode(img_bytes).decode()
-                        mime = "image/png"
-                        try:
-                            response = client.chat.completions.create(
-                                model="nvidia/Nemotron-Nano-V2-12b",
-                                # max_tokens=512,
-                                temperature=0.5,
-                                top_p=0.9,
-                                extra_body={"top_k": 50},
-                                messages=[
-                                    {
-                                        "role": "user",
-                                        "content": [
-                                            {
-                                                "type": "text",
-                                                "text": f"{ocr_prompt}\n\nNote: This is page {i+1} of {num_pages}. Extract content from this page only.",
-                                            },
-                                            {
-                                                "type": "image_url",
-                                                "image_url": {
-                                                    "url": f"data:{mime};base64,{b64_data}"
-                                                },
-                                            },
-                                        ],
-                                    }
-                                ],
-                            )
-                            text = (
-                                response.choices[0].message.content
-                                if hasattr(response.choices[0].message, "content")
-                                else str(response)
-                            )
-                        except Exception as e:
-                            text = f"OCR API call failed on page {i+1}: {e}"
-                        results.append(text)
-                        progress.progress(
-                            (i + 1) / num_pages,
-                            text=f"Processed {i+1} of {num_pages} pages...",
+                    results = asyncio.run(
+                        stream_pdf_ocr(
+                            doc,
+                            ocr_prompt,
+                            api_key,
+                            progress,
+                            concurrency,
+                            requests_per_second,
                         )
+                    )
                     progress.empty()
+                    # The full text is rendered below once stored in session state
+                    ocr_output.empty()
                     return "\n\n".join(results)
             except Exception as e:
                 return f"PDF to image conversion failed: {e}"
@@ -274,7 +428,9 @@ This style is MUCH more readable than heading for every field."""
         display_file_preview(uploaded_file)
         # OCR button
         if st.button("🔍 Extract Text (OCR)"):
-            extracted_text = ocr(uploaded_file, nebius_api_key)
+            extracted_text = ocr(
+                uploaded_file, nebius_api_key, ocr_concurrency, ocr_rps
+            )
             st.session_state.extracted_text = extracted_text
 
 if "extracted_text" not in st.session_state: